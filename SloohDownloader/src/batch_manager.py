@@ -11,7 +11,7 @@ class BatchManager(object):
     """Manages batch download operations"""
     
     def __init__(self, config, slooh_client, download_manager, file_organizer, 
-                 download_tracker, logger=None):
+                 download_tracker, logger=None, max_concurrency=None):
         """
         Initialize batch manager.
         
@@ -22,6 +22,8 @@ class BatchManager(object):
             file_organizer: FileOrganizer instance
             download_tracker: DownloadTracker instance
             logger: Logger instance
+            max_concurrency: Cap on simultaneous downloads; overrides the
+                downloader's 'download.threads' setting when given
         """
         self.config = config
         self.slooh = slooh_client
@@ -35,6 +37,9 @@ class BatchManager(object):
         self.check_tracker = config.get('download.check_tracker', True)
         self.handle_duplicates = config.get('download.handle_duplicates', 'skip')
         
+        if max_concurrency:
+            self.downloader.thread_count = max_concurrency
+        
         # Statistics
         self.session_stats = {
             'total_available': 0,
@@ -32,10 +32,12 @@ class ConfigurationManager(object):
             'config.template.json'
         )
         self.config = None
+        self._loaded_mtime = None
         
     def load(self):
         """
         Load configuration from file. Creates default if not exists.
+        Repeated calls skip the re-parse while the file is unchanged.
         
         Returns:
             dict: Configuration dictionary
@@ -48,12 +50,18 @@ class ConfigurationManager(object):
             self._create_default_config()
         
         try:
+            # Warm path: file unchanged since last parse
+            mtime = os.path.getmtime(self.config_path)
+            if self.config is not None and mtime == self._loaded_mtime:
+                return self.config
+            
             with open(self.config_path, 'r') as f:
                 self.config = json.load(f)
             
             # Expand paths to absolute
             self._expand_paths()
             
+            self._loaded_mtime = mtime
             return self.config
             
         except Exception as e:
@@ -78,6 +86,13 @@ class ConfigurationManager(object):
             # Write configuration
             with open(self.config_path, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            
+            # The in-memory config now matches the file; keep the warm
+            # load() path valid
+            try:
+                self._loaded_mtime = os.path.getmtime(self.config_path)
+            except OSError:
+                self._loaded_mtime = None
                 
         except Exception as e:
             raise Exception("Failed to save configuration: {0}".format(str(e)))
@@ -107,6 +122,46 @@ class ConfigurationManager(object):
         
         return value
     
+    def get_many(self, key_paths, default=None):
+        """
+        Get several configuration values in a single pass.
+
+        Args:
+            key_paths: Iterable of dot-separated paths
+            default: Default value for keys that are not found
+
+        Returns:
+            dict: Mapping of key path to value (or default)
+        """
+        if self.config is None:
+            self.load()
+
+        values = {}
+        for key_path in key_paths:
+            value = self.config
+            for key in key_path.split('.'):
+                if isinstance(value, dict) and key in value:
+                    value = value[key]
+                else:
+                    value = default
+                    break
+            values[key_path] = value
+
+        return values
+
+    def snapshot(self, *key_paths):
+        """
+        Get several values as a tuple for unpacking into locals.
+
+        Args:
+            *key_paths: Dot-separated paths, in the order wanted back
+
+        Returns:
+            tuple: Values in argument order (None for missing keys)
+        """
+        values = self.get_many(key_paths)
+        return tuple(values[key_path] for key_path in key_paths)
+
     def set(self, key_path, value):
         """
         Set configuration value using dot notation.
@@ -251,6 +251,7 @@ class DownloadManager(object):
         Args:
             task: DownloadTask instance
         """
+        self._download_slots.acquire()
         try:
             # Retry loop
             for attempt in range(self.max_retries):
@@ -300,6 +301,8 @@ class DownloadManager(object):
             if self.on_error:
                 self.on_error(task)
         finally:
+            self._download_slots.release()
+            
             with self.lock:
                 self.active_downloads.remove(task)
             
@@ -326,6 +329,11 @@ class DownloadManager(object):
         
         self._log('info', "Starting download of {0} files...".format(self.total_tasks))
         
+        # Bound simultaneous downloads: every task is queued up front, so a
+        # semaphore keeps only thread_count of them active at once
+        slots = self.thread_count if self.thread_count > 0 else self.total_tasks
+        self._download_slots = threading.Semaphore(slots)
+        
         # Queue all tasks
         for task in tasks:
             with self.lock:
@@ -6,8 +6,11 @@ Tracks downloaded images using plain JSON files for simplicity.
 
 import json
 import os
+from collections import Counter
 from datetime import datetime
 import shutil
+import threading
+import queue
 
 
 class DownloadTracker(object):
@@ -35,13 +38,16 @@ class DownloadTracker(object):
             }
         }
         self.current_session = None
+        self._loaded_mtime = None
         
     def load(self):
         """Load tracking data from JSON file"""
         if os.path.exists(self.tracker_file):
             try:
+                mtime = os.path.getmtime(self.tracker_file)
                 with open(self.tracker_file, 'r') as f:
                     self.data = json.load(f)
+                self._loaded_mtime = mtime
                 return True
             except Exception as e:
                 print("Warning: Could not load tracker file: {0}".format(str(e)))
@@ -57,6 +63,24 @@ class DownloadTracker(object):
                         pass
                 return False
         return True  # New file, empty data is OK
+    
+    def load_if_stale(self):
+        """
+        Re-parse the tracker file only if it changed on disk.
+        Cheap to call repeatedly; the common case is one os.stat.
+        
+        Returns:
+            bool: True if the in-memory data is usable
+        """
+        try:
+            mtime = os.path.getmtime(self.tracker_file)
+        except OSError:
+            return True  # New file, empty data is OK
+        
+        if self._loaded_mtime is not None and mtime == self._loaded_mtime:
+            return True
+        
+        return self.load()
         
     def save(self):
         """Save tracking data to JSON file with automatic backup"""
@@ -77,6 +101,12 @@ class DownloadTracker(object):
             with open(self.tracker_file, 'w') as f:
                 json.dump(self.data, f, indent=2)
             
+            # In-memory data now matches the file; keep load_if_stale warm
+            try:
+                self._loaded_mtime = os.path.getmtime(self.tracker_file)
+            except OSError:
+                self._loaded_mtime = None
+            
             return True
             
         except Exception as e:
@@ -230,37 +260,31 @@ class DownloadTracker(object):
             Dictionary with statistics
         """
         try:
-            stats = {
-                'total_images': len(self.data['images']),
-                'total_sessions': len(self.data['sessions']),
-                'total_bytes': 0,
-                'by_type': {},
-                'by_telescope': {},
-                'by_object': {}
-            }
-            
-            # Analyze images
-            for img_key, img in self.data['images'].items():
-                # Total bytes
-                stats['total_bytes'] += img.get('file_size', 0)
-                
-                # By type
-                img_type = img.get('image_type', 'Unknown')
-                stats['by_type'][img_type] = stats['by_type'].get(img_type, 0) + 1
-                
-                # By telescope
-                telescope = img.get('telescope_name', 'Unknown')
-                stats['by_telescope'][telescope] = stats['by_telescope'].get(telescope, 0) + 1
-                
-                # By object
-                obj_name = img.get('object_name', 'Unknown')
-                stats['by_object'][obj_name] = stats['by_object'].get(obj_name, 0) + 1
+            # Single sweep with Counters and a local accumulator; avoids
+            # the get-then-store dict dance per image and per grouping
+            by_type = Counter()
+            by_telescope = Counter()
+            by_object = Counter()
+            total_bytes = 0
+            
+            for img in self.data['images'].values():
+                total_bytes += img.get('file_size', 0)
+                by_type[img.get('image_type', 'Unknown')] += 1
+                by_telescope[img.get('telescope_name', 'Unknown')] += 1
+                by_object[img.get('object_name', 'Unknown')] += 1
             
             # Session totals
             for session in self.data['sessions']:
-                stats['total_bytes'] += session.get('total_bytes', 0)
+                total_bytes += session.get('total_bytes', 0)
             
-            return stats
+            return {
+                'total_images': len(self.data['images']),
+                'total_sessions': len(self.data['sessions']),
+                'total_bytes': total_bytes,
+                'by_type': by_type,
+                'by_telescope': by_telescope,
+                'by_object': by_object
+            }
             
         except Exception as e:
             print("Error getting statistics: {0}".format(str(e)))
@@ -365,37 +389,94 @@ class DownloadTracker(object):
         
         return results
     
-    def find_orphaned_files(self, base_path):
+    def get_tracked_paths(self):
+        """
+        Build the set of tracked file paths, normalized for comparison.
+
+        Returns:
+            frozenset: Case-normalized absolute paths of tracked files
+        """
+        return frozenset(
+            os.path.normcase(os.path.abspath(img['file_path']))
+            for img in self.data['images'].values()
+            if img.get('file_path'))
+
+    def find_orphaned_files(self, base_path, workers=4, tracked_paths=None):
         """
         Find files in the download directory that are not tracked.
-        
+
+        The walk is spread across a few worker threads pulling from a
+        shared directory queue, so outstanding readdir/stat calls overlap
+        instead of serializing on one thread.
+
         Args:
             base_path: Base download directory to scan
-            
+            workers: Number of scan threads
+            tracked_paths: Prebuilt set from get_tracked_paths() (optional,
+                           avoids rebuilding when the caller already has one)
+
         Returns:
             list: List of orphaned file paths
         """
-        tracked_paths = set()
-        for img in self.data['images'].values():
-            file_path = img.get('file_path', '')
-            if file_path:
-                tracked_paths.add(os.path.abspath(file_path))
-        
+        if tracked_paths is None:
+            tracked_paths = self.get_tracked_paths()
+
         orphaned = []
-        
-        # Scan directory for files
-        if os.path.exists(base_path):
-            for root, dirs, files in os.walk(base_path):
-                for filename in files:
-                    # Skip non-image files
-                    if not filename.lower().endswith(('.fits', '.fit', '.png', '.jpg', '.jpeg')):
-                        continue
-                    
-                    full_path = os.path.abspath(os.path.join(root, filename))
-                    
-                    if full_path not in tracked_paths:
-                        orphaned.append(full_path)
-        
+
+        if not os.path.exists(base_path):
+            return orphaned
+
+        image_exts = ('.fits', '.fit', '.png', '.jpg', '.jpeg')
+        dir_queue = queue.Queue()
+        dir_queue.put(os.path.abspath(base_path))
+        result_lock = threading.Lock()
+
+        def scan_worker():
+            while True:
+                directory = dir_queue.get()
+                if directory is None:
+                    dir_queue.task_done()
+                    return
+
+                local = []
+                try:
+                    entries = os.listdir(directory)
+                except OSError:
+                    entries = []
+
+                # Queue paths are already absolute, so files need no
+                # abspath; normalize the directory once instead of
+                # re-normalizing every full path
+                directory_nc = os.path.normcase(directory)
+                for name in entries:
+                    full_path = os.path.join(directory, name)
+                    if os.path.isdir(full_path):
+                        dir_queue.put(full_path)
+                    elif name.lower().endswith(image_exts):
+                        # Skip non-image files
+                        key = os.path.join(directory_nc, os.path.normcase(name))
+                        if key not in tracked_paths:
+                            local.append(full_path)
+
+                if local:
+                    with result_lock:
+                        orphaned.extend(local)
+                dir_queue.task_done()
+
+        threads = []
+        for _ in range(workers):
+            t = threading.Thread(target=scan_worker)
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+        # Wait for the tree to drain, then release the workers
+        dir_queue.join()
+        for _ in threads:
+            dir_queue.put(None)
+        for t in threads:
+            t.join()
+
         return orphaned
     
     def remove_missing_from_tracker(self):
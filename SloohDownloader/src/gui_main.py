@@ -18,8 +18,11 @@ from System.Windows.Forms import (
     DataGridViewSelectionMode, DataGridViewAutoSizeColumnsMode,
     DataGridViewColumnSortMode, BorderStyle, AutoSizeMode, AutoScaleMode,
     ScrollBars, CheckBox, Padding, RowStyle, ColumnStyle, SizeType,
-    FolderBrowserDialog, CheckedListBox, DateTimePicker
+    FolderBrowserDialog, CheckedListBox, DateTimePicker, Timer, Control,
+    TableLayoutPanelCellPosition
 )
+from System.Reflection import BindingFlags
+from System.Collections.Concurrent import ConcurrentQueue
 from System.Drawing import (
     Size, Point, Color, Font, FontStyle, SystemFonts, ContentAlignment
 )
@@ -27,6 +30,8 @@ from System import EventArgs, Action, Threading
 import System
 import sys
 import os
+import heapq
+from datetime import datetime
 
 # Add src directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -41,6 +46,52 @@ from download_tracker import DownloadTracker
 from report_generator import ReportGenerator
 
 
+# Built once at import time so repeated About clicks do no string work
+ABOUT_TEXT = (
+    "Slooh Image Downloader\n\n"
+    "Version 2.0 (Stage 5 - Advanced Features)\n"
+    "IronPython Windows Forms Application\n\n"
+    "Download and organize your Slooh telescope images"
+)
+
+
+# Tracker instances are cached by path and re-read only when the file's
+# mtime changes, so back-to-back history/statistics refreshes parse the
+# tracker JSON once instead of once per handler
+_tracker_cache = {}
+
+
+def _get_tracker(path):
+    """Return a loaded DownloadTracker, reusing it while the file is unchanged"""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+
+    cached = _tracker_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    tracker = DownloadTracker(path)
+    tracker.load()
+    _tracker_cache[path] = (mtime, tracker)
+    return tracker
+
+
+def _invalidate_tracker_cache(path=None):
+    """Drop cached tracker state after the file is mutated on disk"""
+    if path is None:
+        _tracker_cache.clear()
+    else:
+        _tracker_cache.pop(path, None)
+
+
+def _try_parse_int(text, default):
+    """Parse an integer via Int32.TryParse - no exception on invalid input"""
+    ok, value = System.Int32.TryParse(text)
+    return value if ok else default
+
+
 class SloohDownloaderForm(Form):
     """Main application form with DPI-aware layout"""
     
@@ -57,9 +108,57 @@ class SloohDownloaderForm(Form):
         self.MinimumSize = Size(800, 600)
         self.StartPosition = FormStartPosition.CenterScreen
         self.AutoScaleMode = AutoScaleMode.Font  # DPI-aware scaling
-        
+
+        # Shared fonts - each Font is a GDI+ handle, so create the four
+        # bold variants once instead of per-label
+        self._font_bold_9 = Font(SystemFonts.DefaultFont.FontFamily, 9.0, FontStyle.Bold)
+        self._font_bold_10 = Font(SystemFonts.DefaultFont.FontFamily, 10.0, FontStyle.Bold)
+        self._font_bold_12 = Font(SystemFonts.DefaultFont.FontFamily, 12.0, FontStyle.Bold)
+        self._font_bold_14 = Font(SystemFonts.DefaultFont.FontFamily, 14.0, FontStyle.Bold)
+        self.FormClosed += self.OnFormClosed
+
+        # Shared panel padding - Padding is a value type, so one instance
+        # serves every panel instead of six per-panel allocations.
+        # (RowStyle/ColumnStyle objects cannot be shared: a style instance
+        # may only belong to one TableLayoutStyleCollection.)
+        self._pad10 = Padding(10)
+
+        # Debounce timer for start-image date lookups: typing restarts it,
+        # so only the final value triggers an API call. The request id lets
+        # stale in-flight fetches skip their UI update.
+        self._start_img_timer = Timer()
+        self._start_img_timer.Interval = 300
+        self._start_img_timer.Tick += self.OnStartImageTimerTick
+        self._start_img_req_id = 0
+        self._last_start_image_fetched = None
+
+        # Debounced config persistence: changes set a dirty flag and
+        # restart this timer, so a burst of toggles costs one disk write.
+        # OnFormClosed force-flushes anything still pending.
+        self._config_dirty = False
+        self._config_save_timer = Timer()
+        self._config_save_timer.Interval = 500
+        self._config_save_timer.Tick += self.OnConfigSaveTick
+
+        # Cached absolute download directory - os.path.abspath syscalls on
+        # every call, so resolve once and invalidate when the textbox edits
+        self._resolved_download_dir = None
+
+        # Folder browser dialog is created lazily and reused across clicks
+        self._folder_dialog = None
+
+        # Cached marshaling delegates - reused by every cross-thread
+        # update instead of allocating an Action per call
+        self._update_status_action = Action[str](self.UpdateStatus)
+        self._update_hint_action = Action[str](self.UpdateStartImageHint)
+        self._update_stats_action = Action[object](self.UpdateStats)
+        self._download_complete_action = Action(self.DownloadComplete)
+        self._load_history_action = Action(self.LoadHistory)
+        self._load_statistics_action = Action(self.LoadStatistics)
+
         # Create main layout (vertical split)
         self.main_layout = TableLayoutPanel()
+        self._EnableDoubleBuffer(self.main_layout)
         self.main_layout.Dock = DockStyle.Fill
         self.main_layout.RowCount = 3
         self.main_layout.ColumnCount = 1
@@ -72,14 +171,25 @@ class SloohDownloaderForm(Form):
         
         # Create tab control for main content
         self.tabs = TabControl()
+        self._EnableDoubleBuffer(self.tabs)
         self.tabs.Dock = DockStyle.Fill
         
-        # Create tabs
+        # Create tabs. Statistics and Advanced start as empty placeholder
+        # pages and are populated on first selection (OnTabSelecting), so
+        # their controls never exist if the user never opens them.
         self.CreateDownloadTab()
         self.CreateHistoryTab()
         self.CreateConfigTab()
-        self.CreateStatsTab()
-        self.CreateAdvancedTab()
+
+        self._stats_built = False
+        self.stats_tab = TabPage("Statistics")
+        self.tabs.TabPages.Add(self.stats_tab)
+
+        self._advanced_built = False
+        self.advanced_tab = TabPage("Advanced")
+        self.tabs.TabPages.Add(self.advanced_tab)
+
+        self.tabs.Selecting += self.OnTabSelecting
         
         self.main_layout.Controls.Add(self.tabs, 0, 1)
         
@@ -92,6 +202,72 @@ class SloohDownloaderForm(Form):
         # Add Load event handler to adjust splitter after form is shown
         self.Load += self.OnFormLoad
         
+    def OnDownloadDirChanged(self, sender, e):
+        """Invalidate the cached download directory when the textbox edits"""
+        self._resolved_download_dir = None
+
+    def _get_resolved_download_dir(self):
+        """Return the absolute download directory, resolving it at most once.
+
+        Falls back to the configured base path when the textbox is empty.
+        The cache is invalidated by OnDownloadDirChanged.
+        """
+        if self._resolved_download_dir:
+            return self._resolved_download_dir
+
+        download_dir = None
+        try:
+            if self.txt_download_dir and self.txt_download_dir.Text:
+                download_dir = self.txt_download_dir.Text.strip()
+        except:
+            pass
+
+        if not download_dir:
+            download_dir = self.config.get('folders.base_path', 'SloohImages')
+
+        if download_dir and not os.path.isabs(download_dir):
+            download_dir = os.path.abspath(download_dir)
+
+        self._resolved_download_dir = download_dir
+        return download_dir
+
+    def _mark_config_dirty(self):
+        """Flag the config as changed and restart the debounced save timer"""
+        self._config_dirty = True
+        self._config_save_timer.Stop()
+        self._config_save_timer.Start()
+
+    def OnConfigSaveTick(self, sender, e):
+        """Write pending config changes to disk (single coalesced save)"""
+        self._config_save_timer.Stop()
+        if not self._config_dirty:
+            return
+        try:
+            self.config.save()
+            self._config_dirty = False
+        except Exception as ex:
+            self.LogMessage("Error saving configuration: {0}".format(str(ex)))
+
+    def OnFormClosed(self, sender, e):
+        """Handle form closed event - flush pending config, release fonts"""
+        self._config_save_timer.Stop()
+        if self._config_dirty:
+            try:
+                self.config.save()
+            except:
+                pass
+        if self._folder_dialog is not None:
+            try:
+                self._folder_dialog.Dispose()
+            except:
+                pass
+        for font in (self._font_bold_9, self._font_bold_10,
+                     self._font_bold_12, self._font_bold_14):
+            try:
+                font.Dispose()
+            except:
+                pass
+
     def OnFormLoad(self, sender, e):
         """Handle form load event - set splitter to 50% after form is shown"""
         if hasattr(self, 'main_split'):
@@ -167,9 +343,10 @@ class SloohDownloaderForm(Form):
         
         # LEFT PANEL - Credentials and Controls
         left_panel = TableLayoutPanel()
+        self._EnableDoubleBuffer(left_panel)
         left_panel.Dock = DockStyle.Fill
         left_panel.ColumnCount = 2
-        left_panel.Padding = Padding(10)
+        left_panel.Padding = self._pad10
         left_panel.AutoScroll = True
         left_panel.ColumnStyles.Add(ColumnStyle(SizeType.AutoSize))  # Labels
         left_panel.ColumnStyles.Add(ColumnStyle(SizeType.Percent, 100))  # Controls
@@ -179,7 +356,7 @@ class SloohDownloaderForm(Form):
         # Credentials section
         lbl_creds = Label()
         lbl_creds.Text = "Login Credentials"
-        lbl_creds.Font = Font(SystemFonts.DefaultFont.FontFamily, 9.0, FontStyle.Bold)
+        lbl_creds.Font = self._font_bold_9
         lbl_creds.AutoSize = True
         left_panel.Controls.Add(lbl_creds, 0, row)
         left_panel.SetColumnSpan(lbl_creds, 2)
@@ -222,7 +399,7 @@ class SloohDownloaderForm(Form):
         row += 1
         lbl_settings = Label()
         lbl_settings.Text = "Download Settings"
-        lbl_settings.Font = Font(SystemFonts.DefaultFont.FontFamily, 9.0, FontStyle.Bold)
+        lbl_settings.Font = self._font_bold_9
         lbl_settings.AutoSize = True
         left_panel.Controls.Add(lbl_settings, 0, row)
         left_panel.SetColumnSpan(lbl_settings, 2)
@@ -324,7 +501,7 @@ class SloohDownloaderForm(Form):
         row += 1
         lbl_options = Label()
         lbl_options.Text = "Options"
-        lbl_options.Font = Font(SystemFonts.DefaultFont.FontFamily, 9.0, FontStyle.Bold)
+        lbl_options.Font = self._font_bold_9
         lbl_options.AutoSize = True
         left_panel.Controls.Add(lbl_options, 0, row)
         left_panel.SetColumnSpan(lbl_options, 2)
@@ -396,9 +573,10 @@ class SloohDownloaderForm(Form):
         
         # RIGHT PANEL - Filters
         right_panel = TableLayoutPanel()
+        self._EnableDoubleBuffer(right_panel)
         right_panel.Dock = DockStyle.Fill
         right_panel.ColumnCount = 2
-        right_panel.Padding = Padding(10)
+        right_panel.Padding = self._pad10
         right_panel.AutoScroll = True
         right_panel.ColumnStyles.Add(ColumnStyle(SizeType.AutoSize))  # Labels
         right_panel.ColumnStyles.Add(ColumnStyle(SizeType.Percent, 100))  # Controls
@@ -408,7 +586,7 @@ class SloohDownloaderForm(Form):
         # Filters section
         lbl_filters = Label()
         lbl_filters.Text = "Filters (optional)"
-        lbl_filters.Font = Font(SystemFonts.DefaultFont.FontFamily, 9.0, FontStyle.Bold)
+        lbl_filters.Font = self._font_bold_9
         lbl_filters.AutoSize = True
         right_panel.SetColumnSpan(lbl_filters, 2)
         right_panel.Controls.Add(lbl_filters, 0, row)
@@ -425,6 +603,9 @@ class SloohDownloaderForm(Form):
         self.lst_filter_telescope.Anchor = AnchorStyles.Left | AnchorStyles.Right
         self.lst_filter_telescope.Height = 120
         self.lst_filter_telescope.CheckOnClick = True
+        # Skip per-item width measurement during Items.Add
+        self.lst_filter_telescope.HorizontalScrollbar = False
+        self.lst_filter_telescope.UseTabStops = False
         self.lst_filter_telescope.Items.Add("Chile One")
         self.lst_filter_telescope.Items.Add("Chile Two")
         self.lst_filter_telescope.Items.Add("Chile Three")
@@ -460,6 +641,9 @@ class SloohDownloaderForm(Form):
         self.lst_picture_types.Anchor = AnchorStyles.Left | AnchorStyles.Right
         self.lst_picture_types.Height = 60
         self.lst_picture_types.CheckOnClick = True
+        # Skip per-item width measurement during Items.Add
+        self.lst_picture_types.HorizontalScrollbar = False
+        self.lst_picture_types.UseTabStops = False
         self.lst_picture_types.Items.Add("PNG")
         self.lst_picture_types.Items.Add("JPEG")
         self.lst_picture_types.Items.Add("FITS")
@@ -471,7 +655,7 @@ class SloohDownloaderForm(Form):
         row += 1
         lbl_date_section = Label()
         lbl_date_section.Text = "Date Range"
-        lbl_date_section.Font = Font(SystemFonts.DefaultFont.FontFamily, 9.0, FontStyle.Bold)
+        lbl_date_section.Font = self._font_bold_9
         lbl_date_section.AutoSize = True
         right_panel.SetColumnSpan(lbl_date_section, 2)
         right_panel.Controls.Add(lbl_date_section, 0, row)
@@ -534,10 +718,11 @@ class SloohDownloaderForm(Form):
         
         # Bottom panel - Progress display
         progress_panel = TableLayoutPanel()
+        self._EnableDoubleBuffer(progress_panel)
         progress_panel.Dock = DockStyle.Fill
         progress_panel.RowCount = 4
         progress_panel.ColumnCount = 1
-        progress_panel.Padding = Padding(10)
+        progress_panel.Padding = self._pad10
         
         # Row 0-2: AutoSize for labels and progress bar
         # Row 3: Percent for log to fill remaining space
@@ -593,7 +778,13 @@ class SloohDownloaderForm(Form):
         self.grid_history.MultiSelect = False
         self.grid_history.ReadOnly = True
         self.grid_history.AllowUserToAddRows = False
-        
+
+        # Virtual mode: rows are served on demand from _history_view, so
+        # only the visible cells are ever materialized
+        self.grid_history.VirtualMode = True
+        self.grid_history.CellValueNeeded += self.OnHistoryCellValueNeeded
+        self._history_view = []
+
         # Add columns
         self.grid_history.Columns.Add("image_id", "Image ID")
         self.grid_history.Columns.Add("title", "Title")
@@ -608,12 +799,15 @@ class SloohDownloaderForm(Form):
     def CreateConfigTab(self):
         """Create configuration editor tab"""
         tab = TabPage("Configuration")
-        
+        tab.SuspendLayout()
+
         config_panel = TableLayoutPanel()
+        self._EnableDoubleBuffer(config_panel)
+        config_panel.SuspendLayout()
         config_panel.Dock = DockStyle.Fill
         config_panel.RowCount = 11
         config_panel.ColumnCount = 3
-        config_panel.Padding = Padding(10)
+        config_panel.Padding = self._pad10
         
         for i in range(11):
             config_panel.RowStyles.Add(RowStyle(SizeType.AutoSize))
@@ -631,6 +825,7 @@ class SloohDownloaderForm(Form):
         
         self.txt_download_dir = TextBox()
         self.txt_download_dir.Anchor = AnchorStyles.Left | AnchorStyles.Right
+        self.txt_download_dir.TextChanged += self.OnDownloadDirChanged
         config_panel.Controls.Add(self.txt_download_dir, 1, row)
         
         self.btn_browse_folder = Button()
@@ -700,19 +895,42 @@ class SloohDownloaderForm(Form):
         self.btn_save_config.Width = 150
         self.btn_save_config.Click += self.OnSaveConfig
         config_panel.Controls.Add(self.btn_save_config, 1, row)
-        
+
         tab.Controls.Add(config_panel)
+
+        # Single layout pass for the style and row population above
+        config_panel.ResumeLayout(False)
+        tab.ResumeLayout(False)
+        config_panel.PerformLayout()
+
         self.tabs.TabPages.Add(tab)
         
-    def CreateStatsTab(self):
-        """Create statistics dashboard tab"""
-        tab = TabPage("Statistics")
-        
+    def OnTabSelecting(self, sender, e):
+        """Build the Statistics/Advanced tab contents on first selection"""
+        try:
+            if e.TabPage is None:
+                return
+            if e.TabPage.Text == "Statistics" and not self._stats_built:
+                self.CreateStatsTabInto(self.stats_tab)
+                self._stats_built = True
+                self.LoadStatistics()
+            elif e.TabPage.Text == "Advanced" and not self._advanced_built:
+                self.CreateAdvancedTabInto(self.advanced_tab)
+                self._advanced_built = True
+        except Exception as ex:
+            self.LogMessage("Error building tab: {0}".format(str(ex)))
+
+    def CreateStatsTabInto(self, tab):
+        """Populate the statistics dashboard tab"""
+        tab.SuspendLayout()
+
         stats_panel = TableLayoutPanel()
+        self._EnableDoubleBuffer(stats_panel)
+        stats_panel.SuspendLayout()
         stats_panel.Dock = DockStyle.Fill
         stats_panel.RowCount = 8
         stats_panel.ColumnCount = 2
-        stats_panel.Padding = Padding(10)
+        stats_panel.Padding = self._pad10
         
         for i in range(8):
             stats_panel.RowStyles.Add(RowStyle(SizeType.AutoSize))
@@ -722,63 +940,90 @@ class SloohDownloaderForm(Form):
         # Title
         lbl_title = Label()
         lbl_title.Text = "Download Statistics"
-        lbl_title.Font = Font(SystemFonts.DefaultFont.FontFamily, 14.0, FontStyle.Bold)
+        lbl_title.Font = self._font_bold_14
         lbl_title.AutoSize = True
         stats_panel.SetColumnSpan(lbl_title, 2)
         stats_panel.Controls.Add(lbl_title, 0, 0)
         
         row = 1
-        
-        # Total downloads
-        self.AddStatLabel(stats_panel, "Total Downloads:", row)
-        self.lbl_total_downloads = self.AddStatValue(stats_panel, "0", row)
-        
-        # Successful
-        row += 1
-        self.AddStatLabel(stats_panel, "Successful:", row)
-        self.lbl_successful = self.AddStatValue(stats_panel, "0", row)
-        
-        # Failed
-        row += 1
-        self.AddStatLabel(stats_panel, "Failed:", row)
-        self.lbl_failed = self.AddStatValue(stats_panel, "0", row)
-        
-        # Total size
-        row += 1
-        self.AddStatLabel(stats_panel, "Total Size:", row)
-        self.lbl_total_size = self.AddStatValue(stats_panel, "0 MB", row)
-        
-        # Average speed
-        row += 1
-        self.AddStatLabel(stats_panel, "Average Speed:", row)
-        self.lbl_avg_speed = self.AddStatValue(stats_panel, "0 KB/s", row)
-        
-        # Session stats
-        row += 1
+
+        # Stat rows are built into one array and attached with a single
+        # AddRange call - one pass instead of two Controls.Add per row
+        stat_rows = [
+            ('lbl_total_downloads', "Total Downloads:", "0"),
+            ('lbl_successful', "Successful:", "0"),
+            ('lbl_failed', "Failed:", "0"),
+            ('lbl_total_size', "Total Size:", "0 MB"),
+            ('lbl_avg_speed', "Average Speed:", "0 KB/s"),
+        ]
+        controls = []
+        positions = []
+        for attr, caption, initial in stat_rows:
+            lbl = Label()
+            lbl.Text = caption
+            lbl.AutoSize = True
+            lbl.Anchor = AnchorStyles.Left
+            controls.append(lbl)
+            positions.append((lbl, 0, row))
+
+            val = Label()
+            val.Text = initial
+            val.AutoSize = True
+            val.Anchor = AnchorStyles.Right
+            val.Font = self._font_bold_10
+            setattr(self, attr, val)
+            controls.append(val)
+            positions.append((val, 1, row))
+            row += 1
+
+        # Session stats section header
         lbl_session = Label()
         lbl_session.Text = "Current Session"
-        lbl_session.Font = Font(SystemFonts.DefaultFont.FontFamily, 12.0, FontStyle.Bold)
+        lbl_session.Font = self._font_bold_12
         lbl_session.AutoSize = True
-        stats_panel.SetColumnSpan(lbl_session, 2)
-        stats_panel.Controls.Add(lbl_session, 0, row)
-        
-        # Session downloads
+        controls.append(lbl_session)
+        positions.append((lbl_session, 0, row))
         row += 1
-        self.AddStatLabel(stats_panel, "Session Downloads:", row)
-        self.lbl_session_downloads = self.AddStatValue(stats_panel, "0", row)
-        
+
+        # Session downloads
+        lbl = Label()
+        lbl.Text = "Session Downloads:"
+        lbl.AutoSize = True
+        lbl.Anchor = AnchorStyles.Left
+        controls.append(lbl)
+        positions.append((lbl, 0, row))
+
+        self.lbl_session_downloads = Label()
+        self.lbl_session_downloads.Text = "0"
+        self.lbl_session_downloads.AutoSize = True
+        self.lbl_session_downloads.Anchor = AnchorStyles.Right
+        self.lbl_session_downloads.Font = self._font_bold_10
+        controls.append(self.lbl_session_downloads)
+        positions.append((self.lbl_session_downloads, 1, row))
+
+        stats_panel.Controls.AddRange(System.Array[Control](controls))
+        for ctrl, col, r in positions:
+            stats_panel.SetCellPosition(ctrl, TableLayoutPanelCellPosition(col, r))
+        stats_panel.SetColumnSpan(lbl_session, 2)
+
         tab.Controls.Add(stats_panel)
-        self.tabs.TabPages.Add(tab)
-    
-    def CreateAdvancedTab(self):
-        """Create advanced options tab"""
-        tab = TabPage("Advanced")
-        
+
+        # Single layout pass for all the rows added above
+        stats_panel.ResumeLayout(False)
+        tab.ResumeLayout(False)
+        stats_panel.PerformLayout()
+
+    def CreateAdvancedTabInto(self, tab):
+        """Populate the advanced options tab"""
+        tab.SuspendLayout()
+
         advanced_panel = TableLayoutPanel()
+        self._EnableDoubleBuffer(advanced_panel)
+        advanced_panel.SuspendLayout()
         advanced_panel.Dock = DockStyle.Fill
         advanced_panel.RowCount = 15
         advanced_panel.ColumnCount = 3
-        advanced_panel.Padding = Padding(10)
+        advanced_panel.Padding = self._pad10
         
         for i in range(15):
             advanced_panel.RowStyles.Add(RowStyle(SizeType.AutoSize))
@@ -791,7 +1036,7 @@ class SloohDownloaderForm(Form):
         # Title
         lbl_title = Label()
         lbl_title.Text = "Advanced Download Options"
-        lbl_title.Font = Font(SystemFonts.DefaultFont.FontFamily, 12.0, FontStyle.Bold)
+        lbl_title.Font = self._font_bold_12
         lbl_title.AutoSize = True
         advanced_panel.SetColumnSpan(lbl_title, 3)
         advanced_panel.Controls.Add(lbl_title, 0, row)
@@ -800,106 +1045,67 @@ class SloohDownloaderForm(Form):
         row += 1
         lbl_maint_section = Label()
         lbl_maint_section.Text = "Maintenance Tools"
-        lbl_maint_section.Font = Font(SystemFonts.DefaultFont.FontFamily, 10.0, FontStyle.Bold)
+        lbl_maint_section.Font = self._font_bold_10
         lbl_maint_section.AutoSize = True
         advanced_panel.SetColumnSpan(lbl_maint_section, 3)
         advanced_panel.Controls.Add(lbl_maint_section, 0, row)
         
-        # Verify button
-        row += 1
-        btn_verify = Button()
-        btn_verify.Text = "Verify All Downloads"
-        btn_verify.Width = 180
-        btn_verify.Click += self.OnVerifyDownloads
-        advanced_panel.Controls.Add(btn_verify, 1, row)
-        
-        # Find orphaned button
-        row += 1
-        btn_orphaned = Button()
-        btn_orphaned.Text = "Find Orphaned Files"
-        btn_orphaned.Width = 180
-        btn_orphaned.Click += self.OnFindOrphaned
-        advanced_panel.Controls.Add(btn_orphaned, 1, row)
-        
-        # Clean missing button
-        row += 1
-        btn_clean_missing = Button()
-        btn_clean_missing.Text = "Clean Missing from Tracker"
-        btn_clean_missing.Width = 180
-        btn_clean_missing.Click += self.OnCleanMissing
-        advanced_panel.Controls.Add(btn_clean_missing, 1, row)
-        
-        # Clean sessions button
-        row += 1
-        btn_clean_sessions = Button()
-        btn_clean_sessions.Text = "Clean Old Sessions"
-        btn_clean_sessions.Width = 180
-        btn_clean_sessions.Click += self.OnCleanSessions
-        advanced_panel.Controls.Add(btn_clean_sessions, 1, row)
-        
-        # Backup button
-        row += 1
-        btn_backup = Button()
-        btn_backup.Text = "Backup Tracker"
-        btn_backup.Width = 180
-        btn_backup.Click += self.OnBackupTracker
-        advanced_panel.Controls.Add(btn_backup, 1, row)
-        
+        # Maintenance buttons (data-driven: one codepath for all)
+        maintenance_buttons = [
+            ("Verify All Downloads", self.OnVerifyDownloads),
+            ("Find Orphaned Files", self.OnFindOrphaned),
+            ("Clean Missing from Tracker", self.OnCleanMissing),
+            ("Clean Old Sessions", self.OnCleanSessions),
+            ("Backup Tracker", self.OnBackupTracker),
+        ]
+        for text, handler in maintenance_buttons:
+            row += 1
+            self._AddActionButton(advanced_panel, row, text, handler)
+
         # Export Section
         row += 1
         lbl_export_section = Label()
         lbl_export_section.Text = "Export Reports"
-        lbl_export_section.Font = Font(SystemFonts.DefaultFont.FontFamily, 10.0, FontStyle.Bold)
+        lbl_export_section.Font = self._font_bold_10
         lbl_export_section.AutoSize = True
         advanced_panel.SetColumnSpan(lbl_export_section, 3)
         advanced_panel.Controls.Add(lbl_export_section, 0, row)
         
-        # Export CSV button
-        row += 1
-        btn_export_csv = Button()
-        btn_export_csv.Text = "Export to CSV"
-        btn_export_csv.Width = 180
-        btn_export_csv.Click += self.OnExportCSV
-        advanced_panel.Controls.Add(btn_export_csv, 1, row)
-        
-        # Export HTML button
-        row += 1
-        btn_export_html = Button()
-        btn_export_html.Text = "Export to HTML"
-        btn_export_html.Width = 180
-        btn_export_html.Click += self.OnExportHTML
-        advanced_panel.Controls.Add(btn_export_html, 1, row)
-        
-        # Export Statistics button
-        row += 1
-        btn_export_stats = Button()
-        btn_export_stats.Text = "Export Statistics Report"
-        btn_export_stats.Width = 180
-        btn_export_stats.Click += self.OnExportStatistics
-        advanced_panel.Controls.Add(btn_export_stats, 1, row)
-        
+        # Export buttons
+        export_buttons = [
+            ("Export to CSV", self.OnExportCSV),
+            ("Export to HTML", self.OnExportHTML),
+            ("Export Statistics Report", self.OnExportStatistics),
+        ]
+        for text, handler in export_buttons:
+            row += 1
+            self._AddActionButton(advanced_panel, row, text, handler)
+
         tab.Controls.Add(advanced_panel)
-        self.tabs.TabPages.Add(tab)
-        
-    def AddStatLabel(self, panel, text, row):
-        """Add a statistic label"""
-        lbl = Label()
-        lbl.Text = text
-        lbl.AutoSize = True
-        lbl.Anchor = AnchorStyles.Left
-        panel.Controls.Add(lbl, 0, row)
-        return lbl
-        
-    def AddStatValue(self, panel, text, row):
-        """Add a statistic value label"""
-        lbl = Label()
-        lbl.Text = text
-        lbl.AutoSize = True
-        lbl.Anchor = AnchorStyles.Right
-        lbl.Font = Font(SystemFonts.DefaultFont.FontFamily, 10.0, FontStyle.Bold)
-        panel.Controls.Add(lbl, 1, row)
-        return lbl
+
+        # Single layout pass for all the rows added above
+        advanced_panel.ResumeLayout(False)
+        tab.ResumeLayout(False)
+        advanced_panel.PerformLayout()
         
+    def _EnableDoubleBuffer(self, ctrl):
+        """Enable double-buffering on a control via its protected property"""
+        try:
+            prop = clr.GetClrType(Control).GetProperty(
+                'DoubleBuffered', BindingFlags.NonPublic | BindingFlags.Instance)
+            prop.SetValue(ctrl, True, None)
+        except:
+            pass
+
+    def _AddActionButton(self, panel, row, text, handler):
+        """Add an action button to a panel row"""
+        btn = Button()
+        btn.Text = text
+        btn.Width = 180
+        btn.Click += handler
+        panel.Controls.Add(btn, 1, row)
+        return btn
+
     def CreateStatusBar(self):
         """Create status bar"""
         status = StatusStrip()
@@ -916,7 +1122,25 @@ class SloohDownloaderForm(Form):
     def InitializeDownloader(self):
         """Initialize downloader components"""
         try:
+            # Batched UI updates: worker threads enqueue log lines into a
+            # lock-free queue and a 100ms timer on the UI thread drains it,
+            # so each tick costs one AppendText regardless of log volume
+            self._log_queue = ConcurrentQueue[str]()
+            # Progress is coalesced harder still: workers just overwrite
+            # this field and the tick formats whatever dict is current
+            self._latest_progress = None
+            self._applied_progress = None
+            self._last_progress_key = None
+            self._ui_update_timer = Timer()
+            self._ui_update_timer.Interval = 100
+            self._ui_update_timer.Tick += self.OnUiUpdateTick
+            self._ui_update_timer.Start()
+
             self.config = get_config()
+            # Resolve hot config paths once - they never change at runtime,
+            # so handlers skip the dotted-path dict walk per click
+            self._tracker_file = self.config.get(
+                'tracking.tracker_file', 'data/download_tracker.json')
             self.logger = get_logger('SloohDownloader', self.config)
             
             # Register GUI callback to receive log messages
@@ -934,17 +1158,28 @@ class SloohDownloaderForm(Form):
             self.is_downloading = False
             self.is_paused = False
             
+            # Read all startup settings in one pass over the config tree
+            settings = self.config.get_many([
+                'credentials.username',
+                'credentials.password',
+                'folders.base_path',
+                'download.threads',
+                'download.rate_limit',
+                'download.max_retries',
+                'folders.template',
+            ])
+
             # Load saved credentials if available
-            username = self.config.get('credentials.username')
+            username = settings.get('credentials.username')
             if username:
                 self.txt_username.Text = username
-            
-            password = self.config.get('credentials.password')
+
+            password = settings.get('credentials.password')
             if password:
                 self.txt_password.Text = password
-                
+
             # Load configuration into UI
-            self.LoadConfiguration()
+            self.LoadConfiguration(settings)
             
             # Load existing history and statistics
             self.LoadHistory()
@@ -956,7 +1191,8 @@ class SloohDownloaderForm(Form):
             # Auto-login if credentials are saved
             if username and password:
                 self.LogMessage("Auto-login with saved credentials...")
-                Threading.Thread(Threading.ThreadStart(self.AutoLogin)).Start()
+                Threading.ThreadPool.QueueUserWorkItem(
+                    Threading.WaitCallback(lambda _state: self.AutoLogin()))
             
             self.LogMessage("Application initialized")
         except Exception as e:
@@ -967,86 +1203,123 @@ class SloohDownloaderForm(Form):
                 MessageBoxIcon.Error
             )
             
-    def LoadConfiguration(self):
-        """Load configuration into UI"""
+    def LoadConfiguration(self, settings=None):
+        """Load configuration into UI
+
+        Args:
+            settings: Pre-fetched config values keyed by dot path (from
+                get_many). Fetched here if not supplied by the caller.
+        """
         try:
+            if settings is None:
+                settings = self.config.get_many([
+                    'credentials.username',
+                    'credentials.password',
+                    'folders.base_path',
+                    'download.threads',
+                    'download.rate_limit',
+                    'download.max_retries',
+                    'folders.template',
+                ])
+
             # Load credentials
-            username = self.config.get('credentials.username')
-            password = self.config.get('credentials.password')
+            username = settings.get('credentials.username')
+            password = settings.get('credentials.password')
             if username:
                 self.txt_username.Text = username
             if password:
                 self.txt_password.Text = password
-                
+
             # Load download settings with actual defaults
-            base_path = self.config.get('folders.base_path', 'SloohImages')
+            base_path = settings.get('folders.base_path') or 'SloohImages'
             if not os.path.isabs(base_path):
                 base_path = os.path.abspath(base_path)
             self.txt_download_dir.Text = base_path
-            
-            self.txt_max_concurrent.Text = str(self.config.get('download.threads', 4))
-            self.txt_rate_limit.Text = str(self.config.get('download.rate_limit', 30))
-            self.txt_max_retries.Text = str(self.config.get('download.max_retries', 3))
-            self.txt_template.Text = self.config.get('folders.template', '{object}/{telescope}/{format}')
+            # Text assignment invalidated the cache; it already holds the
+            # absolute path, so prime it directly
+            self._resolved_download_dir = base_path
+
+            self.txt_max_concurrent.Text = str(settings.get('download.threads') or 4)
+            self.txt_rate_limit.Text = str(settings.get('download.rate_limit') or 30)
+            self.txt_max_retries.Text = str(settings.get('download.max_retries') or 3)
+            self.txt_template.Text = settings.get('folders.template') or '{object}/{telescope}/{format}'
         except Exception as e:
             self.LogMessage("Error loading configuration: {0}".format(str(e)))
             
     # Event handlers
     def OnLogin(self, sender, e):
         """Handle login button click"""
+        username = self.txt_username.Text
+        password = self.txt_password.Text
+
+        if not username or not password:
+            MessageBox.Show(
+                "Please enter username and password",
+                "Login",
+                MessageBoxButtons.OK,
+                MessageBoxIcon.Warning
+            )
+            return
+
+        self.lbl_status.Text = "Logging in..."
+        self.btn_login.Enabled = False
+
+        # Run login in the background (same pattern as AutoLogin) so the
+        # UI thread keeps pumping without a DoEvents reentrancy hack
+        Threading.ThreadPool.QueueUserWorkItem(
+            Threading.WaitCallback(lambda _state: self._DoLogin(username, password)))
+
+    def _DoLogin(self, username, password):
+        """Background login worker - marshals UI updates back via Invoke"""
         try:
-            username = self.txt_username.Text
-            password = self.txt_password.Text
-            
-            if not username or not password:
-                MessageBox.Show(
-                    "Please enter username and password",
-                    "Login",
-                    MessageBoxButtons.OK,
-                    MessageBoxIcon.Warning
-                )
-                return
-                
-            self.lbl_status.Text = "Logging in..."
-            self.btn_login.Enabled = False
-            Application.DoEvents()
-            
             # Create client and login
             base_url = self.config.get('slooh.base_url', 'https://app.slooh.com')
             self.client = SloohClient(base_url, self.logger)
             self.client.get_session_token()
-            
+
             user_data = self.client.login(username, password)
             if user_data:
                 display_name = user_data.get('displayName', username)
-                self.lbl_status.Text = "Logged in as {0}".format(display_name)
-                self.btn_start.Enabled = True
-                self.LogMessage("Successfully logged in as {0}".format(display_name))
-                
+
                 # Save credentials (including password)
                 self.config.set('credentials.username', username)
                 self.config.set('credentials.password', password)
                 self.config.save()
+
+                def on_success():
+                    self.lbl_status.Text = "Logged in as {0}".format(display_name)
+                    self.btn_start.Enabled = True
+                    self.LogMessage("Successfully logged in as {0}".format(display_name))
+
+                self.Invoke(Action(on_success))
             else:
-                self.lbl_status.Text = "Login failed"
+                def on_failure():
+                    self.lbl_status.Text = "Login failed"
+                    MessageBox.Show(
+                        "Login failed. Please check credentials.",
+                        "Login Error",
+                        MessageBoxButtons.OK,
+                        MessageBoxIcon.Error
+                    )
+                    self.btn_login.Enabled = True
+
+                self.Invoke(Action(on_failure))
+
+        except Exception as ex:
+            error_text = str(ex)
+
+            def on_error():
+                self.lbl_status.Text = "Login error"
                 MessageBox.Show(
-                    "Login failed. Please check credentials.",
-                    "Login Error",
+                    "Login error: {0}".format(error_text),
+                    "Error",
                     MessageBoxButtons.OK,
                     MessageBoxIcon.Error
                 )
                 self.btn_login.Enabled = True
-                
-        except Exception as ex:
-            self.lbl_status.Text = "Login error"
-            MessageBox.Show(
-                "Login error: {0}".format(str(ex)),
-                "Error",
-                MessageBoxButtons.OK,
-                MessageBoxIcon.Error
-            )
-            self.btn_login.Enabled = True
-            
+
+            self.Invoke(Action(on_error))
+
     def OnLogout(self, sender, e):
         """Handle logout"""
         self.client = None
@@ -1072,9 +1345,8 @@ class SloohDownloaderForm(Form):
             # Validate inputs
             mission_id = None
             if not self.chk_all_missions.Checked:
-                try:
-                    mission_id = int(self.txt_mission.Text)
-                except:
+                mission_id = _try_parse_int(self.txt_mission.Text, None)
+                if mission_id is None:
                     MessageBox.Show(
                         "Please enter a valid mission ID",
                         "Input Error",
@@ -1082,66 +1354,59 @@ class SloohDownloaderForm(Form):
                         MessageBoxIcon.Warning
                     )
                     return
-                    
-            max_count = None
-            try:
-                max_count = int(self.txt_max_count.Text)
-            except:
-                pass
-            
-            max_scan = None
-            try:
-                max_scan = int(self.txt_max_scan.Text)
-                if max_scan <= 0:
-                    max_scan = None
-            except:
+
+            max_count = _try_parse_int(self.txt_max_count.Text, None)
+
+            max_scan = _try_parse_int(self.txt_max_scan.Text, None)
+            if max_scan is not None and max_scan <= 0:
                 max_scan = None
             
             # Capture filters from UI
+            # Accumulate filter descriptions and log them in one message
+            # instead of one UI round-trip per filter
             filters = {}
+            log_lines = []
             try:
                 # Get selected telescopes from CheckedListBox
-                selected_telescopes = []
-                for i in range(self.lst_filter_telescope.Items.Count):
-                    if self.lst_filter_telescope.GetItemChecked(i):
-                        selected_telescopes.append(str(self.lst_filter_telescope.Items[i]))
-                
+                selected_telescopes = [str(item) for item in self.lst_filter_telescope.CheckedItems]
+
                 if selected_telescopes:
                     filters['telescopes'] = selected_telescopes
-                    self.LogMessage("Filter: Telescopes - {0}".format(", ".join(selected_telescopes)))
-                
+                    log_lines.append("Filter: Telescopes - {0}".format(", ".join(selected_telescopes)))
+
                 object_filter = self.txt_filter_object.Text.strip()
                 if object_filter:
                     filters['object'] = object_filter
-                    self.LogMessage("Filter: Object contains '{0}'".format(object_filter))
-                
+                    log_lines.append("Filter: Object contains '{0}'".format(object_filter))
+
                 # Picture type filter - collect all checked types
-                selected_picture_types = []
-                for i in range(self.lst_picture_types.Items.Count):
-                    if self.lst_picture_types.GetItemChecked(i):
-                        selected_picture_types.append(str(self.lst_picture_types.Items[i]).lower())
-                
+                selected_picture_types = [str(item).lower() for item in self.lst_picture_types.CheckedItems]
+
                 # Only add filter if not all types are selected (partial selection)
                 if selected_picture_types and len(selected_picture_types) < self.lst_picture_types.Items.Count:
                     filters['picture_types'] = selected_picture_types
-                    self.LogMessage("Filter: Picture types - {0}".format(", ".join(selected_picture_types).upper()))
+                    log_lines.append("Filter: Picture types - {0}".format(", ".join(selected_picture_types).upper()))
                 elif selected_picture_types:
-                    self.LogMessage("Filter: All picture types (PNG, JPEG, FITS)")
-                
+                    log_lines.append("Filter: All picture types (PNG, JPEG, FITS)")
+
                 # Date range filters from DateTimePicker controls
                 if self.chk_use_start_date.Checked:
                     start_date = self.dtp_start_date.Value
                     start_date_str = start_date.ToString("yyyy-MM-dd")
                     filters['start_date'] = start_date_str
-                    self.LogMessage("Filter: Start date >= {0}".format(start_date_str))
-                
+                    log_lines.append("Filter: Start date >= {0}".format(start_date_str))
+
                 if self.chk_use_end_date.Checked:
                     end_date = self.dtp_end_date.Value
                     end_date_str = end_date.ToString("yyyy-MM-dd")
                     filters['end_date'] = end_date_str
-                    self.LogMessage("Filter: End date <= {0}".format(end_date_str))
+                    log_lines.append("Filter: End date <= {0}".format(end_date_str))
             except:
                 filters = {}
+                log_lines = []
+
+            if log_lines:
+                self.LogMessage("\n".join(log_lines))
             
             # Capture dry-run setting
             dry_run = False
@@ -1162,33 +1427,16 @@ class SloohDownloaderForm(Form):
                 force_redownload = False
             
             # Get start image number
-            start_image = 1
-            try:
-                start_image = int(self.txt_start_image.Text)
-                if start_image < 1:
-                    start_image = 1
-                if start_image > 1:
-                    self.LogMessage("Starting from image #{0}".format(start_image))
-            except:
+            start_image = _try_parse_int(self.txt_start_image.Text, 1)
+            if start_image < 1:
                 start_image = 1
+            if start_image > 1:
+                self.LogMessage("Starting from image #{0}".format(start_image))
             
-            # Capture download directory on UI thread (cannot access from background thread)
-            # First check if there's a value in the Configuration tab's textbox
-            download_dir = None
-            try:
-                if self.txt_download_dir and self.txt_download_dir.Text:
-                    download_dir = self.txt_download_dir.Text.strip()
-            except:
-                pass
-            
-            # If not, get from saved config
-            if not download_dir:
-                download_dir = self.config.get('folders.base_path', 'SloohImages')
-            
-            # Make absolute if relative
-            if download_dir and not os.path.isabs(download_dir):
-                download_dir = os.path.abspath(download_dir)
-            
+            # Capture download directory on UI thread (cannot access from
+            # background thread) - cached resolution, no syscalls if unchanged
+            download_dir = self._get_resolved_download_dir()
+
             self.LogMessage("Download directory: {0}".format(download_dir))
                 
             # Start download in background
@@ -1198,12 +1446,15 @@ class SloohDownloaderForm(Form):
             self.btn_stop.Enabled = True
             self.progress_overall.Value = 0
             
-            # Start download thread, passing download_dir captured from UI thread
-            thread = Threading.Thread(Threading.ThreadStart(
-                lambda: self.DownloadWorker(mission_id, max_count, max_scan, start_image, download_dir, filters, dry_run, force_redownload)
-            ))
+            # Start download thread, passing download_dir captured from UI
+            # thread. The arguments travel as one tuple through the thread
+            # state rather than a closure capturing eight cells.
+            args = (mission_id, max_count, max_scan, start_image,
+                    download_dir, filters, dry_run, force_redownload)
+            thread = Threading.Thread(
+                Threading.ParameterizedThreadStart(self._DownloadWorkerEntry))
             thread.IsBackground = True
-            thread.Start()
+            thread.Start(args)
             
         except Exception as ex:
             MessageBox.Show(
@@ -1271,7 +1522,7 @@ class SloohDownloaderForm(Form):
             self.config.set('download.rate_limit', int(self.txt_rate_limit.Text))
             self.config.set('download.max_retries', int(self.txt_max_retries.Text))
             self.config.set('folders.template', self.txt_template.Text)
-            self.config.save()
+            self._mark_config_dirty()
             
             MessageBox.Show(
                 "Configuration saved successfully",
@@ -1291,14 +1542,18 @@ class SloohDownloaderForm(Form):
     def OnBrowseFolder(self, sender, e):
         """Handle browse folder button"""
         try:
-            dialog = FolderBrowserDialog()
-            dialog.Description = "Select download directory"
-            dialog.ShowNewFolderButton = True
-            
+            # Create the dialog once and reuse it - it is a COM-backed
+            # resource, and reuse keeps the last browsed path for free
+            if self._folder_dialog is None:
+                self._folder_dialog = FolderBrowserDialog()
+                self._folder_dialog.Description = "Select download directory"
+                self._folder_dialog.ShowNewFolderButton = True
+            dialog = self._folder_dialog
+
             # Set initial directory if one exists
             if self.txt_download_dir.Text and os.path.exists(self.txt_download_dir.Text):
                 dialog.SelectedPath = self.txt_download_dir.Text
-            
+
             result = dialog.ShowDialog()
             if result == System.Windows.Forms.DialogResult.OK:
                 self.txt_download_dir.Text = dialog.SelectedPath
@@ -1313,15 +1568,7 @@ class SloohDownloaderForm(Form):
             
     def OnAbout(self, sender, e):
         """Show about dialog"""
-        MessageBox.Show(
-            "Slooh Image Downloader\n\n" +
-            "Version 2.0 (Stage 5 - Advanced Features)\n" +
-            "IronPython Windows Forms Application\n\n" +
-            "Download and organize your Slooh telescope images",
-            "About",
-            MessageBoxButtons.OK,
-            MessageBoxIcon.Information
-        )
+        MessageBox.Show(ABOUT_TEXT, "About", MessageBoxButtons.OK, MessageBoxIcon.Information)
     
     def AutoLogin(self):
         """Auto-login with saved credentials"""
@@ -1365,9 +1612,9 @@ class SloohDownloaderForm(Form):
                 # Set to INFO level
                 self.config.set('logging.log_level', 'INFO')
                 self.LogMessage("Debug logging disabled")
-            
-            self.config.save()
-            
+
+            self._mark_config_dirty()
+
             MessageBox.Show(
                 "Log level changed. Please restart the application for changes to take effect.",
                 "Log Level Changed",
@@ -1378,31 +1625,54 @@ class SloohDownloaderForm(Form):
             self.LogMessage("Error changing log level: {0}".format(str(ex)))
     
     def OnStartImageChanged(self, sender, e):
-        """Handle start image number change - preview the date of that image"""
+        """Handle start image number change - debounce then preview the date"""
+        # Restart the debounce timer; the fetch happens in the Tick handler
+        # only after typing has paused, so "1234" costs one request not four
+        self._start_img_timer.Stop()
+        self._start_img_timer.Start()
+
+    def OnStartImageTimerTick(self, sender, e):
+        """Debounced start image lookup - preview the date of that image"""
+        self._start_img_timer.Stop()
+        self._start_img_req_id += 1
+        req_id = self._start_img_req_id
+
         try:
             start_num = int(self.txt_start_image.Text)
-            
+
+            # Same value as the last successful lookup (reselect/paste) -
+            # the hint is already correct, skip the HTTP call
+            if start_num == self._last_start_image_fetched:
+                return
+
             # Only fetch date if not default value (1) and logged in
             if start_num != 1 and self.client and self.client.is_authenticated:
                 # Fetch in background thread to avoid blocking UI
                 def fetch_date():
                     try:
                         self.UpdateStatus("Fetching image #{0} date...".format(start_num))
-                        
+
                         # Get single image at that position
                         response = self.client.get_pictures(first=start_num, max_count=1, mission_id=0, view_type='photoRoll')
+
+                        # A newer lookup superseded this one - drop the result
+                        if req_id != self._start_img_req_id:
+                            return
+
+                        self._last_start_image_fetched = start_num
+
                         images = response.get('imageList', [])
                         total_count = response.get('totalCount', 0)
-                        
+
                         # Convert totalCount to int if it's a string
                         if isinstance(total_count, str):
                             total_count = int(total_count) if total_count else 0
-                        
+
                         if images:
                             picture = images[0]
                             # Extract date from displayDate
                             display_date = picture.get('displayDate', '')
-                            
+
                             if display_date:
                                 # Update hint label and status with date and total count
                                 date_text = "(Date: {0}) - Total: {1:,} images".format(display_date, total_count)
@@ -1416,15 +1686,17 @@ class SloohDownloaderForm(Form):
                         else:
                             self.UpdateStartImageHint("(Image not found)")
                             self.UpdateStatus("Image #{0} not found".format(start_num))
-                            
+
                     except Exception as ex:
+                        if req_id != self._start_img_req_id:
+                            return
                         self.UpdateStartImageHint("(Error fetching date)")
                         self.UpdateStatus("Error fetching image date: {0}".format(str(ex)))
-                
-                # Run in background thread
-                thread = Threading.Thread(Threading.ThreadStart(fetch_date))
-                thread.IsBackground = True
-                thread.Start()
+
+                # Run on the CLR thread pool - short-lived fetches do not
+                # warrant a dedicated OS thread each
+                Threading.ThreadPool.QueueUserWorkItem(
+                    Threading.WaitCallback(lambda _state: fetch_date()))
             else:
                 # Reset to default hint
                 self.UpdateStartImageHint("(1 = most recent)")
@@ -1437,6 +1709,10 @@ class SloohDownloaderForm(Form):
         """Handle exit"""
         self.Close()
         
+    def _DownloadWorkerEntry(self, state):
+        """Thread entry point - unpacks the argument tuple for DownloadWorker"""
+        self.DownloadWorker(*state)
+
     def DownloadWorker(self, mission_id, max_count, max_scan, start_image, download_dir, filters=None, dry_run=False, force_redownload=False):
         """Background download worker"""
         try:
@@ -1451,7 +1727,7 @@ class SloohDownloaderForm(Form):
             file_organizer = FileOrganizer(self.config, self.logger)
             
             # DownloadTracker only needs the tracker file path
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
+            tracker_file = self._tracker_file
             download_tracker = DownloadTracker(tracker_file)
             download_tracker.load()
             
@@ -1508,56 +1784,90 @@ class SloohDownloaderForm(Form):
                     force_redownload=force_redownload
                 )
                 
-            # Update statistics
-            self.UpdateStats(stats)
-            
+            # Stats + status + log applied in one cross-thread hop
             if dry_run:
                 queued_count = stats.get('queued', 0)
-                self.UpdateStatus("Dry run complete - Found {0} images (preview only)".format(queued_count))
-                self.LogMessage("DRY RUN: {0} images would be downloaded".format(queued_count))
+                self._UpdateEndOfRun(
+                    stats,
+                    "Dry run complete - Found {0} images (preview only)".format(queued_count),
+                    "DRY RUN: {0} images would be downloaded".format(queued_count))
             else:
-                self.UpdateStatus("Download complete")
-            
+                self._UpdateEndOfRun(stats, "Download complete")
+
         except Exception as ex:
             self.UpdateStatus("Error: {0}".format(str(ex)))
         finally:
             self.DownloadComplete()
     
-    def UpdateStartImageHint(self, hint_text):
-        """Update start image hint label (thread-safe)"""
-        if self.InvokeRequired:
-            self.Invoke(Action[str](self.UpdateStartImageHint), hint_text)
-            return
-        self.lbl_start_image_hint.Text = hint_text
-            
+    def OnUiUpdateTick(self, sender, e):
+        """Apply the latest progress and flush queued log lines"""
+        # Apply the newest progress dict if it changed since last tick
+        latest = self._latest_progress
+        if latest is not None and latest is not self._applied_progress:
+            self._applied_progress = latest
+            self._ApplyProgress(latest)
+
+        # Drain a bounded batch of log lines into a single AppendText call
+        chunks = []
+        for _ in range(200):
+            ok, line = self._log_queue.TryDequeue()
+            if not ok:
+                break
+            chunks.append(line)
+
+        if chunks:
+            try:
+                self.txt_log.AppendText("".join(chunks))
+                # Keep the buffer bounded - an ever-growing TextBox makes
+                # every append reallocate the whole backing string
+                if self.txt_log.TextLength > 200000:
+                    self.txt_log.Text = self.txt_log.Text[-150000:]
+                    self.txt_log.SelectionStart = self.txt_log.TextLength
+            except:
+                pass
+
     def UpdateProgress(self, progress):
-        """Update progress display (thread-safe)"""
-        if self.InvokeRequired:
-            self.Invoke(Action[object](self.UpdateProgress), progress)
-            return
-            
+        """Record the latest progress dict (thread-safe, lock-free)
+
+        Workers call this at arbitrary rate; only the most recent dict is
+        kept and the UI timer formats and displays it once per tick.
+        """
+        self._latest_progress = progress
+
+    def _ApplyProgress(self, progress):
+        """Format and display a progress dict (UI thread only)"""
         try:
             percent = progress.get('percent', 0)
-            self.progress_overall.Value = min(100, max(0, int(percent)))
-            
+            value = min(100, max(0, int(percent)))
+
             current = progress.get('current', 0)
             total = progress.get('total', 0)
-            
+
+            # Skip the WinForms property setters (each invalidates and
+            # repaints) when nothing visible actually changed
+            key = (value, current, total, progress.get('batch_number'))
+            if key == self._last_progress_key:
+                return
+            self._last_progress_key = key
+
             # Include batch information if available
             if 'batch_number' in progress:
                 batch_num = progress['batch_number']
                 batch_size = progress.get('batch_size', 0)
-                self.lbl_current_file.Text = "Batch #{0}: Downloading {1} of {2}".format(batch_num, current, batch_size)
+                text = "Batch #{0}: Downloading {1} of {2}".format(batch_num, current, batch_size)
             else:
-                self.lbl_current_file.Text = "Downloading {0} of {1}".format(current, total)
-                
+                text = "Downloading {0} of {1}".format(current, total)
+
+            self.progress_overall.Value = value
+            self.lbl_current_file.Text = text
+
         except Exception as ex:
             self.LogMessage("Error updating progress: {0}".format(str(ex)))
             
     def UpdateStatus(self, message):
         """Update status label (thread-safe)"""
         if self.InvokeRequired:
-            self.Invoke(Action[str](self.UpdateStatus), message)
+            self.BeginInvoke(self._update_status_action, System.Array[object]([message]))
             return
             
         self.lbl_status.Text = message
@@ -1566,16 +1876,20 @@ class SloohDownloaderForm(Form):
     def UpdateStartImageHint(self, hint_text):
         """Update start image hint label (thread-safe)"""
         if self.InvokeRequired:
-            self.Invoke(Action[str](self.UpdateStartImageHint), hint_text)
+            self.BeginInvoke(self._update_hint_action, System.Array[object]([hint_text]))
             return
         self.lbl_start_image_hint.Text = hint_text
         
     def UpdateStats(self, stats):
         """Update statistics display (thread-safe)"""
         if self.InvokeRequired:
-            self.Invoke(Action[object](self.UpdateStats), stats)
+            self.Invoke(self._update_stats_action, stats)
             return
-            
+
+        # Stats tab is built lazily - nothing to update until it exists
+        if not self._stats_built:
+            return
+
         try:
             # Handle both formats: 'total'/'completed' and 'queued'/'downloaded'
             total = stats.get('total', stats.get('queued', 0))
@@ -1596,7 +1910,7 @@ class SloohDownloaderForm(Form):
     def DownloadComplete(self):
         """Reset UI after download completes (thread-safe)"""
         if self.InvokeRequired:
-            self.Invoke(Action(self.DownloadComplete))
+            self.Invoke(self._download_complete_action)
             return
             
         self.is_downloading = False
@@ -1610,32 +1924,50 @@ class SloohDownloaderForm(Form):
         self.download_manager = None
         self.batch_manager = None
         
-        # Load updated history and statistics after download completes
+        # Load updated history and statistics after download completes.
+        # Both already run on the UI thread here and share the memoized
+        # tracker, so the file is parsed once for the pair.
         self.LoadHistory()
         self.LoadStatistics()
-        
+
+    def _UpdateEndOfRun(self, stats, status, log=None):
+        """Apply end-of-run stats, status and log in a single marshal"""
+        if self.InvokeRequired:
+            self.Invoke(Action(lambda: self._UpdateEndOfRun(stats, status, log)))
+            return
+
+        self.UpdateStats(stats)
+        self.lbl_status.Text = status
+        self.LogMessage(status)
+        if log:
+            self.LogMessage(log)
+
     def LoadHistory(self):
         """Load download history into grid (thread-safe)"""
         if self.InvokeRequired:
-            self.Invoke(Action(self.LoadHistory))
+            self.Invoke(self._load_history_action)
             return
             
         try:
             # Load tracker
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-            tracker = DownloadTracker(tracker_file)
-            tracker.load()
-            
-            # Clear existing rows
-            self.grid_history.Rows.Clear()
-            
+            tracker_file = self._tracker_file
+            tracker = _get_tracker(tracker_file)
+
             # Get all downloaded images
             images = tracker.data.get('images', {})
             
-            # Add rows (most recent first)
-            items = sorted(images.items(), key=lambda x: x[1].get('download_date', ''), reverse=True)
-            
-            for image_key, image_data in items[:100]:  # Limit to 100 most recent
+            # Select the 100 most recent without sorting the whole tracker.
+            # Decorating up front also avoids per-comparison dict lookups;
+            # the unique image key breaks date ties before the dict is compared.
+            decorated = [(data.get('download_date', ''), key, data)
+                         for key, data in images.items()]
+            items = heapq.nlargest(100, decorated)
+
+            # Build the backing list for the virtual grid - cells are
+            # served on demand, so no DataGridViewRow objects are created
+            view = []
+            date_cache = {}  # Raw ISO string -> display string (dates repeat)
+            for _, image_key, image_data in items:
                 # Get title - use object_name or filename if object_name is empty
                 title = image_data.get('object_name', '')
                 if not title or title == 'Unknown':
@@ -1649,38 +1981,52 @@ class SloohDownloaderForm(Form):
                 
                 # Format date for display
                 if download_date:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(download_date.replace('Z', '+00:00').split('+')[0])
-                        download_date = dt.strftime('%Y-%m-%d %H:%M')
-                    except:
-                        pass
-                
-                self.grid_history.Rows.Add(
-                    image_key,
-                    title,
-                    download_date,
-                    telescope,
-                    "Downloaded",
-                    file_path
-                )
-            
-            self.LogMessage("Loaded {0} history items".format(len(items)))
-            
+                    formatted = date_cache.get(download_date)
+                    if formatted is None:
+                        try:
+                            dt = datetime.fromisoformat(download_date.replace('Z', '+00:00').split('+')[0])
+                            formatted = dt.strftime('%Y-%m-%d %H:%M')
+                        except:
+                            formatted = download_date
+                        date_cache[download_date] = formatted
+                    download_date = formatted
+
+
+                view.append((image_key, title, download_date, telescope,
+                             "Downloaded", file_path))
+
+            self._history_view = view
+            self.grid_history.RowCount = 0
+            self.grid_history.RowCount = len(view)
+            self.grid_history.Invalidate()
+
+            self.LogMessage("Loaded {0} history items".format(len(decorated)))
+
         except Exception as ex:
             self.LogMessage("Error loading history: {0}".format(str(ex)))
+
+    def OnHistoryCellValueNeeded(self, sender, e):
+        """Serve history grid cells on demand (VirtualMode)"""
+        try:
+            if 0 <= e.RowIndex < len(self._history_view):
+                e.Value = self._history_view[e.RowIndex][e.ColumnIndex]
+        except:
+            pass
             
     def LoadStatistics(self):
         """Load statistics from tracker (thread-safe)"""
         if self.InvokeRequired:
-            self.Invoke(Action(self.LoadStatistics))
+            self.Invoke(self._load_statistics_action)
             return
-            
+
+        # Stats tab is built lazily - it refreshes itself on first selection
+        if not self._stats_built:
+            return
+
         try:
             # Load tracker
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-            tracker = DownloadTracker(tracker_file)
-            tracker.load()
+            tracker_file = self._tracker_file
+            tracker = _get_tracker(tracker_file)
             
             # Get statistics
             stats = tracker.get_statistics()
@@ -1725,12 +2071,11 @@ class SloohDownloaderForm(Form):
             dlg.FileName = "slooh_downloads.csv"
             
             if dlg.ShowDialog() == DialogResult.OK:
-                tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-                tracker = DownloadTracker(tracker_file)
-                tracker.load()
+                tracker_file = self._tracker_file
+                tracker = _get_tracker(tracker_file)
                 
-                from report_generator import ReportGenerator
-                generator = ReportGenerator(tracker, self.logger)
+                from report_generator import get_report_generator
+                generator = get_report_generator(tracker, self.logger)
                 
                 if generator.export_csv(dlg.FileName):
                     MessageBox.Show(
@@ -1766,12 +2111,11 @@ class SloohDownloaderForm(Form):
             dlg.FileName = "slooh_downloads.html"
             
             if dlg.ShowDialog() == DialogResult.OK:
-                tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-                tracker = DownloadTracker(tracker_file)
-                tracker.load()
+                tracker_file = self._tracker_file
+                tracker = _get_tracker(tracker_file)
                 
-                from report_generator import ReportGenerator
-                generator = ReportGenerator(tracker, self.logger)
+                from report_generator import get_report_generator
+                generator = get_report_generator(tracker, self.logger)
                 
                 if generator.export_html(dlg.FileName):
                     MessageBox.Show(
@@ -1807,12 +2151,11 @@ class SloohDownloaderForm(Form):
             dlg.FileName = "slooh_statistics.html"
             
             if dlg.ShowDialog() == DialogResult.OK:
-                tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-                tracker = DownloadTracker(tracker_file)
-                tracker.load()
+                tracker_file = self._tracker_file
+                tracker = _get_tracker(tracker_file)
                 
-                from report_generator import ReportGenerator
-                generator = ReportGenerator(tracker, self.logger)
+                from report_generator import get_report_generator
+                generator = get_report_generator(tracker, self.logger)
                 
                 # Determine format based on extension
                 format = 'html' if dlg.FileName.lower().endswith('.html') else 'txt'
@@ -1841,86 +2184,104 @@ class SloohDownloaderForm(Form):
             )
             
     def OnVerifyDownloads(self, sender, e):
-        """Verify all tracked downloads still exist"""
+        """Verify all tracked downloads - IO runs off the UI thread"""
+        tracker_file = self._tracker_file
+        sender.Enabled = False
+        self.LogMessage("Verifying downloads...")
+        Threading.ThreadPool.QueueUserWorkItem(
+            Threading.WaitCallback(lambda _state: self._DoVerifyDownloads(sender, tracker_file)))
+
+    def _DoVerifyDownloads(self, button, tracker_file):
+        """Background worker: stat every tracked file, marshal results back"""
         try:
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-            tracker = DownloadTracker(tracker_file)
-            tracker.load()
-            
-            self.LogMessage("Verifying downloads...")
+            tracker = _get_tracker(tracker_file)
             results = tracker.verify_downloads()
             
-            message = "Verification Results:\n\n"
-            message += "Total tracked: {0}\n".format(results['total'])
-            message += "Valid: {0}\n".format(results['valid'])
-            message += "Missing: {0}\n".format(results['missing'])
-            message += "Errors: {0}".format(results['errors'])
-            
+            parts = [
+                "Verification Results:\n",
+                "Total tracked: {0}".format(results['total']),
+                "Valid: {0}".format(results['valid']),
+                "Missing: {0}".format(results['missing']),
+                "Errors: {0}".format(results['errors']),
+            ]
+
             if results['missing'] > 0:
-                message += "\n\nMissing files:\n"
-                for mf in results['missing_files'][:10]:  # Show first 10
-                    message += "- {0}\n".format(mf.get('filename', 'Unknown'))
+                parts.append("\nMissing files:")
+                # Show first 10 - single join, no quadratic += churn
+                parts.extend("- " + mf.get('filename', 'Unknown')
+                             for mf in results['missing_files'][:10])
                 if results['missing'] > 10:
-                    message += "... and {0} more".format(results['missing'] - 10)
-            
-            MessageBox.Show(
-                message,
-                "Verification Complete",
-                MessageBoxButtons.OK,
-                MessageBoxIcon.Information
-            )
+                    parts.append("... and {0} more".format(results['missing'] - 10))
+
+            message = "\n".join(parts)
+
+            def show_results():
+                button.Enabled = True
+                MessageBox.Show(
+                    message,
+                    "Verification Complete",
+                    MessageBoxButtons.OK,
+                    MessageBoxIcon.Information
+                )
+            self.Invoke(Action(show_results))
             self.LogMessage("Verification complete: {0} valid, {1} missing".format(
                 results['valid'], results['missing']))
-                
+
         except Exception as ex:
-            MessageBox.Show(
-                "Verification error: {0}".format(str(ex)),
-                "Error",
-                MessageBoxButtons.OK,
-                MessageBoxIcon.Error
-            )
-            
+            error_msg = "Verification error: {0}".format(str(ex))
+
+            def show_error():
+                button.Enabled = True
+                MessageBox.Show(error_msg, "Error", MessageBoxButtons.OK, MessageBoxIcon.Error)
+            self.Invoke(Action(show_error))
+
     def OnFindOrphaned(self, sender, e):
-        """Find orphaned files not in tracker"""
+        """Find orphaned files not in tracker - IO runs off the UI thread"""
+        tracker_file = self._tracker_file
+        base_path = self._get_resolved_download_dir()
+
+        sender.Enabled = False
+        self.LogMessage("Scanning for orphaned files in: {0}".format(base_path))
+        Threading.ThreadPool.QueueUserWorkItem(
+            Threading.WaitCallback(
+                lambda _state: self._DoFindOrphaned(sender, tracker_file, base_path)))
+
+    def _DoFindOrphaned(self, button, tracker_file, base_path):
+        """Background worker: walk the image tree, marshal results back"""
         try:
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-            tracker = DownloadTracker(tracker_file)
-            tracker.load()
-            
-            base_path = self.config.get('folders.base_path', 'SloohImages')
-            if not os.path.isabs(base_path):
-                base_path = os.path.abspath(base_path)
-            
-            self.LogMessage("Scanning for orphaned files in: {0}".format(base_path))
+            tracker = _get_tracker(tracker_file)
             orphaned = tracker.find_orphaned_files(base_path)
             
-            message = "Found {0} orphaned file(s)\n\n".format(len(orphaned))
-            
             if orphaned:
-                message += "Orphaned files:\n"
-                for f in orphaned[:20]:  # Show first 20
-                    message += "- {0}\n".format(os.path.basename(f))
+                parts = ["Found {0} orphaned file(s)\n".format(len(orphaned)),
+                         "Orphaned files:"]
+                # Show first 20 - single join, no quadratic += churn
+                parts.extend("- " + os.path.basename(f) for f in orphaned[:20])
                 if len(orphaned) > 20:
-                    message += "... and {0} more".format(len(orphaned) - 20)
+                    parts.append("... and {0} more".format(len(orphaned) - 20))
+                message = "\n".join(parts)
             else:
                 message = "No orphaned files found. All files are tracked."
-            
-            MessageBox.Show(
-                message,
-                "Orphaned Files",
-                MessageBoxButtons.OK,
-                MessageBoxIcon.Information
-            )
+
+            def show_results():
+                button.Enabled = True
+                MessageBox.Show(
+                    message,
+                    "Orphaned Files",
+                    MessageBoxButtons.OK,
+                    MessageBoxIcon.Information
+                )
+            self.Invoke(Action(show_results))
             self.LogMessage("Found {0} orphaned files".format(len(orphaned)))
-                
+
         except Exception as ex:
-            MessageBox.Show(
-                "Error finding orphaned files: {0}".format(str(ex)),
-                "Error",
-                MessageBoxButtons.OK,
-                MessageBoxIcon.Error
-            )
-            
+            error_msg = "Error finding orphaned files: {0}".format(str(ex))
+
+            def show_error():
+                button.Enabled = True
+                MessageBox.Show(error_msg, "Error", MessageBoxButtons.OK, MessageBoxIcon.Error)
+            self.Invoke(Action(show_error))
+
     def OnCleanMissing(self, sender, e):
         """Remove missing files from tracker"""
         try:
@@ -1932,41 +2293,58 @@ class SloohDownloaderForm(Form):
             )
             
             if result == DialogResult.Yes:
-                tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-                tracker = DownloadTracker(tracker_file)
-                tracker.load()
-                
-                removed = tracker.remove_missing_from_tracker()
-                
+                tracker_file = self._tracker_file
+                sender.Enabled = False
+                Threading.ThreadPool.QueueUserWorkItem(
+                    Threading.WaitCallback(
+                        lambda _state: self._DoCleanMissing(sender, tracker_file)))
+
+        except Exception as ex:
+            MessageBox.Show(
+                "Cleanup error: {0}".format(str(ex)),
+                "Error",
+                MessageBoxButtons.OK,
+                MessageBoxIcon.Error
+            )
+
+    def _DoCleanMissing(self, button, tracker_file):
+        """Background worker: drop tracker entries whose files are gone"""
+        try:
+            tracker = _get_tracker(tracker_file)
+            removed = tracker.remove_missing_from_tracker()
+            _invalidate_tracker_cache(tracker_file)
+
+            def show_results():
+                button.Enabled = True
                 MessageBox.Show(
                     "Removed {0} missing entries from tracker".format(removed),
                     "Cleanup Complete",
                     MessageBoxButtons.OK,
                     MessageBoxIcon.Information
                 )
-                self.LogMessage("Cleaned {0} missing entries".format(removed))
-                
                 # Reload history
                 self.LoadHistory()
                 self.LoadStatistics()
-                
+            self.Invoke(Action(show_results))
+            self.LogMessage("Cleaned {0} missing entries".format(removed))
+
         except Exception as ex:
-            MessageBox.Show(
-                "Cleanup error: {0}".format(str(ex)),
-                "Error",
-                MessageBoxButtons.OK,
-                MessageBoxIcon.Error
-            )
+            error_msg = "Cleanup error: {0}".format(str(ex))
+
+            def show_error():
+                button.Enabled = True
+                MessageBox.Show(error_msg, "Error", MessageBoxButtons.OK, MessageBoxIcon.Error)
+            self.Invoke(Action(show_error))
             
     def OnCleanSessions(self, sender, e):
         """Clean old session data"""
         try:
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-            tracker = DownloadTracker(tracker_file)
-            tracker.load()
+            tracker_file = self._tracker_file
+            tracker = _get_tracker(tracker_file)
             
             tracker.clear_session_data(keep_last_n=10)
-            
+            _invalidate_tracker_cache(tracker_file)
+
             MessageBox.Show(
                 "Old session data cleaned. Kept last 10 sessions.",
                 "Cleanup Complete",
@@ -1987,9 +2365,8 @@ class SloohDownloaderForm(Form):
     def OnBackupTracker(self, sender, e):
         """Backup tracker file"""
         try:
-            tracker_file = self.config.get('tracking.tracker_file', 'data/download_tracker.json')
-            tracker = DownloadTracker(tracker_file)
-            tracker.load()
+            tracker_file = self._tracker_file
+            tracker = _get_tracker(tracker_file)
             
             if tracker.backup():
                 MessageBox.Show(
@@ -2015,15 +2392,10 @@ class SloohDownloaderForm(Form):
             )
         
     def LogMessage(self, message):
-        """Add message to log (thread-safe)"""
-        if self.InvokeRequired:
-            self.Invoke(Action[str](self.LogMessage), message)
-            return
-            
+        """Queue message for the log (thread-safe, batched)"""
         try:
-            from datetime import datetime
             timestamp = datetime.now().strftime('%H:%M:%S')
-            self.txt_log.AppendText("[{0}] {1}\r\n".format(timestamp, message))
+            self._log_queue.Enqueue("[{0}] {1}\r\n".format(timestamp, message))
         except:
             pass
 
@@ -2046,6 +2418,14 @@ def main():
         )
         import traceback
         traceback.print_exc()
+    finally:
+        # The file logger buffers behind its drain thread, so close it
+        # here or the lines queued since the last drain pass are lost
+        try:
+            from logger import close_logger
+            close_logger()
+        except Exception:
+            pass
         
 
 if __name__ == '__main__':
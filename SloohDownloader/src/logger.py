@@ -7,6 +7,8 @@ import clr
 clr.AddReference('System')
 from System import DateTime, IO
 from System.IO import File, Path, Directory, StreamWriter, FileMode
+from System.Collections.Concurrent import ConcurrentQueue
+from System.Threading import Thread, ThreadStart
 from datetime import datetime as py_datetime
 
 
@@ -42,7 +44,20 @@ class Logger(object):
         self.log_folder = log_folder
         self.log_file_path = None
         self.writer = None
-        self.callbacks = []  # List of callback functions for custom handlers (e.g., GUI)
+        # Custom handlers (e.g., GUI). Kept as a copy-on-write tuple so
+        # _write can iterate a snapshot without locking against mutation
+        self.callbacks = ()
+
+        # Precomputed "LEVEL: " prefixes - avoids a dict lookup and a
+        # str.format parse per log line
+        self._prefix_by_level = dict(
+            (lvl, name + ": ") for lvl, name in self.LEVEL_NAMES.items())
+
+        # File writes are queued and drained by a background thread so
+        # callers never pay per-line WriteLine/Flush syscall latency
+        self._queue = ConcurrentQueue[str]()
+        self._drain_thread = None
+        self._closing = False
         
         if log_folder:
             self._setup_log_file()
@@ -57,56 +72,91 @@ class Logger(object):
         filename = "{0}_{1}.log".format(self.name, timestamp)
         self.log_file_path = Path.Combine(self.log_folder, filename)
         
-        # Open file stream for appending
+        # Open file stream for appending; flushing is handled by the
+        # drain thread so many lines share one syscall
         self.writer = StreamWriter(self.log_file_path, True)
+        self.writer.AutoFlush = False
+        
+        self._drain_thread = Thread(ThreadStart(self._drain))
+        self._drain_thread.IsBackground = True
+        self._drain_thread.Start()
+    
+    def _drain(self):
+        """Background loop: batch queued lines to disk, one flush per pass"""
+        while not self._closing:
+            Thread.Sleep(250)
+            self._flush_queue()
+    
+    def _flush_queue(self):
+        """Write everything queued so far, then flush once"""
+        wrote = False
+        while True:
+            ok, line = self._queue.TryDequeue()
+            if not ok:
+                break
+            try:
+                self.writer.WriteLine(line)
+                wrote = True
+            except Exception as e:
+                print("Error writing to log file: {0}".format(str(e)))
+                return
+        
+        if wrote:
+            try:
+                self.writer.Flush()
+            except Exception as e:
+                print("Error flushing log file: {0}".format(str(e)))
     
     def _write(self, level, message):
         """Internal write method"""
         if level < self.level:
             return
         
-        # Format log entry
+        # Format log entry - plain concatenation beats str.format here
         timestamp = py_datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        level_name = self.LEVEL_NAMES.get(level, 'UNKNOWN')
-        formatted = "[{0}] {1}: {2}".format(timestamp, level_name, message)
+        formatted = "[" + timestamp + "] " + self._prefix_by_level[level] + message
         
         # Write to console
         print(formatted)
         
-        # Write to file if configured
+        # Queue for the drain thread if file logging is configured
         if self.writer:
-            try:
-                self.writer.WriteLine(formatted)
-                self.writer.Flush()
-            except Exception as e:
-                print("Error writing to log file: {0}".format(str(e)))
+            self._queue.Enqueue(formatted)
         
-        # Call registered callbacks (e.g., GUI handlers)
-        for callback in self.callbacks:
-            try:
-                callback(level, message)
-            except Exception as e:
-                print("Error in log callback: {0}".format(str(e)))
+        # Call registered callbacks (e.g., GUI handlers) - snapshot read,
+        # and skip loop setup entirely in the common no-callback case
+        cbs = self.callbacks
+        if cbs:
+            for callback in cbs:
+                try:
+                    callback(level, message)
+                except Exception as e:
+                    print("Error in log callback: {0}".format(str(e)))
     
     def debug(self, message):
         """Log debug message"""
-        self._write(self.DEBUG, message)
+        if self.DEBUG >= self.level:
+            self._write(self.DEBUG, message)
     
     def info(self, message):
         """Log info message"""
-        self._write(self.INFO, message)
+        if self.INFO >= self.level:
+            self._write(self.INFO, message)
     
     def warning(self, message):
         """Log warning message"""
-        self._write(self.WARNING, message)
+        if self.WARNING >= self.level:
+            self._write(self.WARNING, message)
     
     def error(self, message):
         """Log error message"""
-        self._write(self.ERROR, message)
+        if self.ERROR >= self.level:
+            self._write(self.ERROR, message)
     
     def critical(self, message):
         """Log critical message"""
-        self._write(self.CRITICAL, message)
+        if self.CRITICAL >= self.level:
+            self._write(self.CRITICAL, message)
     
     def exception(self, message, exc):
         """Log exception with stack trace"""
@@ -120,7 +170,7 @@ class Logger(object):
             callback: Function with signature callback(level, message)
         """
         if callback not in self.callbacks:
-            self.callbacks.append(callback)
+            self.callbacks = self.callbacks + (callback,)
     
     def remove_callback(self, callback):
         """Remove a callback function
@@ -129,11 +179,20 @@ class Logger(object):
             callback: The callback function to remove
         """
         if callback in self.callbacks:
-            self.callbacks.remove(callback)
+            self.callbacks = tuple(cb for cb in self.callbacks if cb is not callback)
     
     def close(self):
-        """Close log file"""
+        """Stop the drain thread, flush remaining lines and close the file"""
+        self._closing = True
+        if self._drain_thread is not None:
+            try:
+                self._drain_thread.Join(500)
+            except:
+                pass
+            self._drain_thread = None
+        
         if self.writer:
+            self._flush_queue()
             self.writer.Close()
             self.writer = None
     
@@ -145,6 +204,13 @@ class Logger(object):
 # Global logger instance
 _global_logger = None
 
+def close_logger():
+    """Flush and close the global logger, if one was created"""
+    global _global_logger
+    if _global_logger is not None:
+        _global_logger.close()
+        _global_logger = None
+
 def get_logger(name='SloohDownloader', config=None):
     """Get or create global logger instance"""
     global _global_logger
@@ -8,128 +8,233 @@ clr.AddReference('System')
 from System import Environment
 from System.IO import Path
 import sys
+import os
+import threading
+import time
 
 # Add src directory to path for imports
 script_dir = Path.GetDirectoryName(__file__)
 if script_dir not in sys.path:
     sys.path.append(script_dir)
 
+from collections import namedtuple
+
 from config_manager import ConfigurationManager, get_config
 from logger import Logger, get_logger
-from slooh_client import SloohClient
-from download_manager import DownloadManager
-from file_organizer import FileOrganizer
-from batch_manager import BatchManager
-from download_tracker import DownloadTracker
+
+# The networking/download stack (SloohClient, DownloadManager, etc.) is
+# imported lazily inside the handlers that need it, so --help, --stats
+# and --configure do not pay its parse/JIT cost at startup
+
+
+class SessionContext(object):
+    """Shared components for one interactive menu session.
+
+    Building the client, download manager, organizer and tracker once per
+    session (and logging in once) avoids repeating the TLS handshake,
+    credential round-trip and full tracker parse on every menu action.
+    """
+
+    def __init__(self, config_manager, logger):
+        self.config_manager = config_manager
+        self.logger = logger
+        self.client = None
+        self.downloader = None
+        self.organizer = None
+        self.tracker = None
+        self.batch_manager = None
+        self.authenticated = False
+
+    def ensure_components(self):
+        """Create the shared components on first use
+
+        Returns:
+            BatchManager: The session's batch manager
+        """
+        if self.batch_manager is None:
+            from slooh_client import SloohClient
+            from download_manager import DownloadManager
+            from file_organizer import FileOrganizer
+            from batch_manager import BatchManager
+            from download_tracker import DownloadTracker
+            
+            cm = self.config_manager
+            base_url, tracker_file = cm.snapshot(
+                'slooh.base_url', 'tracking.tracker_file')
+            self.client = SloohClient(base_url, self.logger)
+            self.downloader = DownloadManager(cm.config, self.logger)
+            self.organizer = FileOrganizer(cm.config, self.logger)
+            self.tracker = DownloadTracker(tracker_file)
+            self.tracker.load()
+            self.batch_manager = BatchManager(
+                cm.config, self.client, self.downloader,
+                self.organizer, self.tracker, self.logger,
+                max_concurrency=cm.get('download.threads', 4))
+        else:
+            # Cheap staleness check; re-parses only if another process
+            # changed the tracker file
+            self.tracker.load_if_stale()
+        # Menu actions toggle download.check_tracker around a run, so a
+        # session-scoped manager must pick up the current value each
+        # time (the constructor cannot resolve the dotted key from the
+        # plain config dict it is handed)
+        self.batch_manager.check_tracker = self.config_manager.get(
+            'download.check_tracker', True)
+        return self.batch_manager
+
+    def ensure_login(self):
+        """Authenticate once per session, reusing the token afterwards
+
+        Returns:
+            str: The authenticated username
+        """
+        username = self.config_manager.get('slooh.username')
+        if not self.authenticated:
+            username = login_with_cache(self.client, self.config_manager)
+            self.authenticated = True
+        return username
+
+    def close(self):
+        """Release session resources at menu exit"""
+        if self.client is not None:
+            try:
+                self.client.close()
+            except:
+                pass
+        if self.downloader is not None:
+            try:
+                self.downloader.close()
+            except:
+                pass
+
+
+# Static console text, pre-joined once at import time so each redraw is
+# a single console write instead of one per line
+_BANNER = "\n".join([
+    "=" * 60,
+    " Slooh Image Downloader v2.0 (Stage 2)",
+    " IronPython Edition",
+    "=" * 60,
+    "",
+    "NOTE: Interactive menu works best in PowerShell/Command Prompt",
+    "      If you experience input issues, use command-line options:",
+    "      Example: ipy src/main.py --configure",
+    "",
+    ""])
+
+_USAGE = "\n".join([
+    "Usage:",
+    "  ipy main.py                   Interactive menu mode",
+    "  ipy main.py --configure       Setup or edit configuration",
+    "  ipy main.py --test            Test configuration and authentication",
+    "  ipy main.py --download        Download all new images",
+    "  ipy main.py --download-all    Download ALL images (ignores tracker)",
+    "  ipy main.py --mission <id>    Download specific mission",
+    "  ipy main.py --retry           Retry failed downloads",
+    "  ipy main.py --stats           Show download statistics",
+    "  ipy main.py --help            Show this help",
+    "",
+    ""])
+
+_MENU = "\n".join([
+    "",
+    "=" * 60,
+    " SLOOH DOWNLOADER - MAIN MENU",
+    "=" * 60,
+    "",
+    "  1. Configure settings",
+    "  2. Test authentication",
+    "  3. Download new images",
+    "  4. Download ALL images (ignores tracker)",
+    "  5. Download specific mission",
+    "  6. Retry failed downloads",
+    "  7. Show download statistics",
+    "  8. Help",
+    "  0. Exit",
+    "",
+    ""])
 
 
 def print_banner():
     """Print application banner"""
-    print("=" * 60)
-    print(" Slooh Image Downloader v2.0 (Stage 2)")
-    print(" IronPython Edition")
-    print("=" * 60)
-    print()
-    print("NOTE: Interactive menu works best in PowerShell/Command Prompt")
-    print("      If you experience input issues, use command-line options:")
-    print("      Example: ipy src/main.py --configure")
-    print()
+    sys.stdout.write(_BANNER)
 
 
 def print_usage():
     """Print usage information"""
-    print("Usage:")
-    print("  ipy main.py                   Interactive menu mode")
-    print("  ipy main.py --configure       Setup or edit configuration")
-    print("  ipy main.py --test            Test configuration and authentication")
-    print("  ipy main.py --download        Download all new images")
-    print("  ipy main.py --download-all    Download ALL images (ignores tracker)")
-    print("  ipy main.py --mission <id>    Download specific mission")
-    print("  ipy main.py --retry           Retry failed downloads")
-    print("  ipy main.py --stats           Show download statistics")
-    print("  ipy main.py --help            Show this help")
-    print()
+    sys.stdout.write(_USAGE)
 
 
 def show_menu():
     """Display interactive menu"""
-    print()
-    print("=" * 60)
-    print(" SLOOH DOWNLOADER - MAIN MENU")
-    print("=" * 60)
-    print()
-    print("  1. Configure settings")
-    print("  2. Test authentication")
-    print("  3. Download new images")
-    print("  4. Download ALL images (ignores tracker)")
-    print("  5. Download specific mission")
-    print("  6. Retry failed downloads")
-    print("  7. Show download statistics")
-    print("  8. Help")
-    print("  0. Exit")
-    print()
+    sys.stdout.write(_MENU)
 
 
 def interactive_menu(config_manager, logger):
     """Run interactive menu loop"""
-    while True:
-        show_menu()
-        try:
-            choice = safe_input("Select option (0-8): ").strip()
-            print()
+    # Session-scoped components: login and tracker parse happen once per
+    # session instead of once per menu action
+    ctx = SessionContext(config_manager, logger)
+    try:
+        while True:
+            show_menu()
+            try:
+                choice = safe_input("Select option (0-8): ").strip()
+                print()
+                
+                if choice == '0':
+                    print("Exiting...")
+                    return 0
+                
+                elif choice == '1':
+                    configure_interactive(config_manager)
+                
+                elif choice == '2':
+                    test_authentication(config_manager, logger)
+                
+                elif choice == '3':
+                    download_new_images(config_manager, logger, ctx)
+                
+                elif choice == '4':
+                    download_all_images(config_manager, logger, ctx)
+                
+                elif choice == '5':
+                    mission_id = safe_input("Enter mission ID: ").strip()
+                    try:
+                        mission_id = int(mission_id)
+                        download_mission(mission_id, config_manager, logger, ctx)
+                    except ValueError:
+                        print("ERROR: Invalid mission ID")
+                
+                elif choice == '6':
+                    retry_failed(config_manager, logger, ctx)
+                
+                elif choice == '7':
+                    show_stats(config_manager, ctx)
+                
+                elif choice == '8':
+                    print_usage()
+                
+                else:
+                    print("Invalid option. Please select 0-8.")
+                
+                # Pause before showing menu again
+                if choice != '0':
+                    print()
+                    safe_input("Press Enter to continue...")
             
-            if choice == '0':
-                print("Exiting...")
+            except KeyboardInterrupt:
+                print("\n\nExiting...")
                 return 0
-            
-            elif choice == '1':
-                configure_interactive(config_manager)
-            
-            elif choice == '2':
-                test_authentication(config_manager, logger)
-            
-            elif choice == '3':
-                download_new_images(config_manager, logger)
-            
-            elif choice == '4':
-                download_all_images(config_manager, logger)
-            
-            elif choice == '5':
-                mission_id = safe_input("Enter mission ID: ").strip()
-                try:
-                    mission_id = int(mission_id)
-                    download_mission(mission_id, config_manager, logger)
-                except ValueError:
-                    print("ERROR: Invalid mission ID")
-            
-            elif choice == '6':
-                retry_failed(config_manager, logger)
-            
-            elif choice == '7':
-                show_stats(config_manager)
-            
-            elif choice == '8':
-                print_usage()
-            
-            else:
-                print("Invalid option. Please select 0-8.")
-            
-            # Pause before showing menu again
-            if choice != '0':
-                print()
+            except Exception as e:
+                print("ERROR: {0}".format(str(e)))
                 safe_input("Press Enter to continue...")
-        
-        except KeyboardInterrupt:
-            print("\n\nExiting...")
-            return 0
-        except Exception as e:
-            print("ERROR: {0}".format(str(e)))
-            safe_input("Press Enter to continue...")
+    finally:
+        ctx.close()
 
 
 def safe_input(prompt):
     """Safe input function that works better with IronPython console"""
-    import sys
     try:
         sys.stdout.write(prompt)
         sys.stdout.flush()
@@ -190,6 +295,31 @@ def configure_interactive(config_manager):
     return True
 
 
+def login_with_cache(client, config_manager):
+    """Authenticate, reusing the cached session token while it is fresh
+
+    Args:
+        client: SloohClient instance
+        config_manager: ConfigurationManager instance
+
+    Returns:
+        str: The authenticated username
+    """
+    username = config_manager.get('slooh.username')
+    cache_path = config_manager.get('slooh.session_cache', 'data/session_cache.json')
+    
+    if cache_path and client.load_session(cache_path):
+        return username
+    
+    password = config_manager.get('slooh.password')
+    client.login(username, password)
+    
+    if cache_path:
+        client.save_session(cache_path)
+    
+    return username
+
+
 def test_authentication(config_manager, logger):
     """Test Slooh authentication"""
     print("\n--- Testing Slooh Authentication ---\n")
@@ -200,29 +330,45 @@ def test_authentication(config_manager, logger):
         print("Run with --configure to set up credentials.")
         return False
     
-    username = config_manager.get('slooh.username')
-    base_url = config_manager.get('slooh.base_url')
+    username, base_url = config_manager.snapshot(
+        'slooh.username', 'slooh.base_url')
     
     print("Slooh URL: {0}".format(base_url))
     print("Username: {0}".format(username))
     print()
     
     # Create client
+    from slooh_client import SloohClient
     client = SloohClient(base_url, logger)
     
     try:
-        # Test connection
-        print("1. Testing connection...")
-        if not client.test_connection():
-            print("   FAILED: Could not connect to Slooh")
-            return False
-        print("   SUCCESS: Connected to Slooh")
-        
-        # Test authentication
-        print("\n2. Testing authentication...")
+        # Test authentication; a successful login doubles as the
+        # connectivity check, saving a round-trip
+        print("1. Testing authentication...")
         password = config_manager.get('slooh.password')
         user_data = client.login(username, password)
         
+        # Cache the session so the next command can skip the login
+        # round-trips while the token is fresh
+        cache_path = config_manager.get('slooh.session_cache', 'data/session_cache.json')
+        if cache_path:
+            client.save_session(cache_path)
+        
+        # Start the mission fetch now so it overlaps the user-info
+        # printing below instead of blocking after it
+        from System.Threading import ThreadPool, WaitCallback
+        mission_result = {}
+        mission_done = threading.Event()
+        
+        def fetch_missions(_state):
+            try:
+                mission_result['response'] = client.get_missions(first=1, max_count=1)
+            except Exception as e:
+                mission_result['error'] = str(e)
+            mission_done.set()
+        
+        ThreadPool.QueueUserWorkItem(WaitCallback(fetch_missions))
+        
         print("   SUCCESS: Authenticated!")
         print("\n   User Information:")
         print("   - Display Name: {0}".format(user_data.get('displayName')))
@@ -231,17 +377,18 @@ def test_authentication(config_manager, logger):
         print("   - Member Since: {0}".format(user_data.get('memberSince')))
         
         # Test getting missions
-        print("\n3. Testing API access...")
-        try:
-            response = client.get_missions(first=1, max_count=1)
+        print("\n2. Testing API access...")
+        mission_done.wait()
+        if 'error' in mission_result:
+            print("   WARNING: Could not get missions: {0}".format(mission_result['error']))
+        else:
+            response = mission_result['response']
             total = response.get('totalCount', 0)
             print("   SUCCESS: Found {0} total missions".format(total))
             
             if 'imageList' in response and response['imageList']:
                 mission = response['imageList'][0]
                 print("   Latest mission: {0}".format(mission.get('imageTitle', 'Untitled')))
-        except Exception as e:
-            print("   WARNING: Could not get missions: {0}".format(str(e)))
         
         print("\n" + "=" * 60)
         print("All tests passed! Configuration is working correctly.")
@@ -256,8 +403,12 @@ def test_authentication(config_manager, logger):
         client.close()
 
 
-def download_new_images(config_manager, logger):
-    """Download new images since last session"""
+def download_new_images(config_manager, logger, ctx=None):
+    """Download new images since last session
+
+    Args:
+        ctx: Optional SessionContext whose components/login are reused
+    """
     print("\n--- Downloading New Images ---\n")
     
     if not config_manager.has_credentials():
@@ -265,30 +416,61 @@ def download_new_images(config_manager, logger):
         print("Run with --configure to set up credentials.")
         return False
     
+    owns_components = ctx is None
+    client = None
+    downloader = None
     try:
-        # Initialize components
-        client = SloohClient(config_manager.get('slooh.base_url'), logger)
-        downloader = DownloadManager(config_manager.config, logger)
-        organizer = FileOrganizer(config_manager.config, logger)
-        tracker = DownloadTracker(config_manager.get('tracking.tracker_file'))
-        tracker.load()
-        
-        batch_manager = BatchManager(
-            config_manager.config, client, downloader, organizer, tracker, logger)
-        
-        # Set up progress callback
+        # Initialize components (or reuse the session's)
+        if ctx is not None:
+            batch_manager = ctx.ensure_components()
+            client = ctx.client
+        else:
+            from slooh_client import SloohClient
+            from download_manager import DownloadManager
+            from file_organizer import FileOrganizer
+            from batch_manager import BatchManager
+            from download_tracker import DownloadTracker
+            
+            base_url, tracker_file = config_manager.snapshot(
+                'slooh.base_url', 'tracking.tracker_file')
+            client = SloohClient(base_url, logger)
+            downloader = DownloadManager(config_manager.config, logger)
+            organizer = FileOrganizer(config_manager.config, logger)
+            tracker = DownloadTracker(tracker_file)
+            tracker.load()
+            
+            batch_manager = BatchManager(
+                config_manager.config, client, downloader, organizer, tracker, logger,
+                max_concurrency=config_manager.get('download.threads', 4))
+            # Apply the download_all_images toggle; the constructor reads
+            # the plain config dict, which cannot resolve the dotted key
+            batch_manager.check_tracker = config_manager.get(
+                'download.check_tracker', True)
+        
+        # Set up progress callback; completions arrive on worker threads,
+        # so serialize the writes and coalesce them to at most one line
+        # per 100 ms (the final update always prints)
+        progress_lock = threading.Lock()
+        last_print = [0.0]
         def on_progress(progress):
-            print("  Progress: {0}/{1} ({2:.1f}%) - {3} active".format(
-                progress['completed'], progress['total'], 
-                progress['percent'], progress['active']))
+            now = time.time()
+            with progress_lock:
+                if (progress['completed'] != progress['total']
+                        and now - last_print[0] < 0.1):
+                    return
+                last_print[0] = now
+                print("  Progress: {0}/{1} ({2:.1f}%) - {3} active".format(
+                    progress['completed'], progress['total'], 
+                    progress['percent'], progress['active']))
         
         batch_manager.on_progress = on_progress
         
-        # Authenticate
+        # Authenticate (no-op on an already logged-in session)
         print("Authenticating...")
-        username = config_manager.get('slooh.username')
-        password = config_manager.get('slooh.password')
-        client.login(username, password)
+        if ctx is not None:
+            username = ctx.ensure_login()
+        else:
+            username = login_with_cache(client, config_manager)
         print("Authenticated as: {0}\n".format(username))
         
         # Download new images
@@ -313,13 +495,14 @@ def download_new_images(config_manager, logger):
         logger.error("Download failed: {0}".format(str(e)))
         return False
     finally:
-        if 'client' in locals():
-            client.close()
-        if 'downloader' in locals():
-            downloader.close()
+        if owns_components:
+            if client is not None:
+                client.close()
+            if downloader is not None:
+                downloader.close()
 
 
-def download_all_images(config_manager, logger):
+def download_all_images(config_manager, logger, ctx=None):
     """Download ALL images (ignoring tracker)"""
     print("\n--- Downloading ALL Images ---\n")
     print("WARNING: This will download all images, even if already downloaded.")
@@ -334,35 +517,56 @@ def download_all_images(config_manager, logger):
     config_manager.set('download.check_tracker', False)
     
     try:
-        return download_new_images(config_manager, logger)
+        return download_new_images(config_manager, logger, ctx)
     finally:
         config_manager.set('download.check_tracker', original_check)
 
 
-def download_mission(mission_id, config_manager, logger):
-    """Download specific mission"""
+def download_mission(mission_id, config_manager, logger, ctx=None):
+    """Download specific mission
+
+    Args:
+        ctx: Optional SessionContext whose components/login are reused
+    """
     print("\n--- Downloading Mission {0} ---\n".format(mission_id))
     
     if not config_manager.has_credentials():
         print("ERROR: Slooh credentials not configured.")
         return False
     
+    owns_components = ctx is None
+    client = None
+    downloader = None
     try:
-        # Initialize components
-        client = SloohClient(config_manager.get('slooh.base_url'), logger)
-        downloader = DownloadManager(config_manager.config, logger)
-        organizer = FileOrganizer(config_manager.config, logger)
-        tracker = DownloadTracker(config_manager.get('tracking.tracker_file'))
-        tracker.load()
-        
-        batch_manager = BatchManager(
-            config_manager.config, client, downloader, organizer, tracker, logger)
+        # Initialize components (or reuse the session's)
+        if ctx is not None:
+            batch_manager = ctx.ensure_components()
+            client = ctx.client
+        else:
+            from slooh_client import SloohClient
+            from download_manager import DownloadManager
+            from file_organizer import FileOrganizer
+            from batch_manager import BatchManager
+            from download_tracker import DownloadTracker
+            
+            base_url, tracker_file = config_manager.snapshot(
+                'slooh.base_url', 'tracking.tracker_file')
+            client = SloohClient(base_url, logger)
+            downloader = DownloadManager(config_manager.config, logger)
+            organizer = FileOrganizer(config_manager.config, logger)
+            tracker = DownloadTracker(tracker_file)
+            tracker.load()
+            
+            batch_manager = BatchManager(
+                config_manager.config, client, downloader, organizer, tracker, logger,
+                max_concurrency=config_manager.get('download.threads', 4))
         
-        # Authenticate
+        # Authenticate (no-op on an already logged-in session)
         print("Authenticating...")
-        username = config_manager.get('slooh.username')
-        password = config_manager.get('slooh.password')
-        client.login(username, password)
+        if ctx is not None:
+            ctx.ensure_login()
+        else:
+            login_with_cache(client, config_manager)
         
         # Download mission
         stats = batch_manager.download_mission(mission_id)
@@ -381,17 +585,29 @@ def download_mission(mission_id, config_manager, logger):
         print("ERROR: {0}".format(str(e)))
         return False
     finally:
-        if 'client' in locals():
+        if owns_components and client is not None:
             client.close()
 
 
-def retry_failed(config_manager, logger):
-    """Retry failed downloads"""
+def retry_failed(config_manager, logger, ctx=None):
+    """Retry failed downloads
+
+    Args:
+        ctx: Optional SessionContext whose components/login are reused
+    """
     print("\n--- Retrying Failed Downloads ---\n")
     
+    owns_components = ctx is None
+    client = None
     try:
-        tracker = DownloadTracker(config_manager.get('tracking.tracker_file'))
-        tracker.load()
+        if ctx is not None:
+            batch_manager = ctx.ensure_components()
+            client = ctx.client
+            tracker = ctx.tracker
+        else:
+            from download_tracker import DownloadTracker
+            tracker = DownloadTracker(config_manager.get('tracking.tracker_file'))
+            tracker.load()
         
         failed = tracker.get_failed_downloads()
         if not failed:
@@ -400,18 +616,26 @@ def retry_failed(config_manager, logger):
         
         print("Found {0} failed downloads\n".format(len(failed)))
         
-        # Initialize components
-        client = SloohClient(config_manager.get('slooh.base_url'), logger)
-        downloader = DownloadManager(config_manager.config, logger)
-        organizer = FileOrganizer(config_manager.config, logger)
-        
-        batch_manager = BatchManager(
-            config_manager.config, client, downloader, organizer, tracker, logger)
+        # Initialize components (or reuse the session's)
+        if ctx is None:
+            from slooh_client import SloohClient
+            from download_manager import DownloadManager
+            from file_organizer import FileOrganizer
+            from batch_manager import BatchManager
+            
+            client = SloohClient(config_manager.get('slooh.base_url'), logger)
+            downloader = DownloadManager(config_manager.config, logger)
+            organizer = FileOrganizer(config_manager.config, logger)
+            
+            batch_manager = BatchManager(
+                config_manager.config, client, downloader, organizer, tracker, logger,
+                max_concurrency=config_manager.get('download.threads', 4))
         
-        # Authenticate
-        username = config_manager.get('slooh.username')
-        password = config_manager.get('slooh.password')
-        client.login(username, password)
+        # Authenticate (no-op on an already logged-in session)
+        if ctx is not None:
+            ctx.ensure_login()
+        else:
+            login_with_cache(client, config_manager)
         
         # Retry
         stats = batch_manager.resume_failed_downloads()
@@ -429,17 +653,26 @@ def retry_failed(config_manager, logger):
         print("ERROR: {0}".format(str(e)))
         return False
     finally:
-        if 'client' in locals():
+        if owns_components and client is not None:
             client.close()
 
 
-def show_stats(config_manager):
-    """Show download statistics"""
+def show_stats(config_manager, ctx=None):
+    """Show download statistics
+
+    Args:
+        ctx: Optional SessionContext whose loaded tracker is reused
+    """
     print("\n--- Download Statistics ---\n")
     
     try:
-        tracker = DownloadTracker(config_manager.get('tracking.tracker_file'))
-        tracker.load()
+        if ctx is not None and ctx.tracker is not None:
+            tracker = ctx.tracker
+            tracker.load_if_stale()
+        else:
+            from download_tracker import DownloadTracker
+            tracker = DownloadTracker(config_manager.get('tracking.tracker_file'))
+            tracker.load()
         
         stats = tracker.get_statistics()
         
@@ -460,6 +693,7 @@ def show_stats(config_manager):
             print("  Date: {0}".format(stats['last_download']))
         
         # Show folder stats
+        from file_organizer import FileOrganizer
         organizer = FileOrganizer(config_manager.config)
         folder_stats = organizer.get_folder_stats()
         
@@ -474,13 +708,55 @@ def show_stats(config_manager):
         print("ERROR: {0}".format(str(e)))
 
 
+# Parsed command-line state; single source of truth for the handlers
+CliArgs = namedtuple('CliArgs', ['command', 'mission_id', 'show_help'])
+
+# Recognized command flags in precedence order
+_COMMAND_FLAGS = ('--configure', '--test', '--download', '--download-all',
+                  '--mission', '--retry', '--stats')
+
+
+def parse_args(argv):
+    """Parse command-line arguments in a single pass.
+
+    Args:
+        argv: Full argument list (argv[0] is the interpreter/script)
+
+    Returns:
+        CliArgs: Parsed command-line state; command is None when no
+            recognized flag was given
+    """
+    seen = set()
+    mission_id = None
+    show_help = False
+
+    for i, arg in enumerate(argv):
+        if not arg.startswith('--'):
+            continue
+        if arg == '--help':
+            show_help = True
+        else:
+            seen.add(arg)
+            if arg == '--mission' and i + 1 < len(argv):
+                mission_id = argv[i + 1]
+
+    command = None
+    for flag in _COMMAND_FLAGS:
+        if flag in seen:
+            command = flag
+            break
+
+    return CliArgs(command, mission_id, show_help)
+
+
 def main():
     """Main entry point"""
     print_banner()
     
-    # Parse command line arguments
-    args = Environment.GetCommandLineArgs()
-    
+    # Parse command line arguments - materialize the CLR array once and
+    # collect flags in a single pass instead of one scan per option
+    args = list(Environment.GetCommandLineArgs())
+
     # Check for help or no arguments - show interactive menu
     if len(args) < 2:
         # No arguments - run interactive menu
@@ -494,10 +770,12 @@ def main():
             print("ERROR: Failed to initialize: {0}".format(str(e)))
             return 1
     
-    if '--help' in args:
+    cli = parse_args(args)
+
+    if cli.show_help:
         print_usage()
         return 0
-    
+
     # Initialize configuration
     try:
         config_manager = ConfigurationManager()
@@ -511,61 +789,40 @@ def main():
         print("ERROR: Failed to initialize: {0}".format(str(e)))
         return 1
     
-    # Handle commands
-    if '--configure' in args:
-        if configure_interactive(config_manager):
-            return 0
-        else:
-            return 1
-    
-    elif '--test' in args:
-        if test_authentication(config_manager, logger):
-            return 0
-        else:
-            return 1
-    
-    elif '--download' in args:
-        if download_new_images(config_manager, logger):
-            return 0
-        else:
-            return 1
-    
-    elif '--download-all' in args:
-        if download_all_images(config_manager, logger):
-            return 0
-        else:
-            return 1
-    
-    elif '--mission' in args:
+    # Handle the parsed command via a dispatch table; each handler
+    # returns truthy on success
+    def run_mission():
+        if cli.mission_id is None:
+            print("ERROR: --mission requires mission ID")
+            return False
         try:
-            mission_idx = args.index('--mission')
-            if mission_idx + 1 < len(args):
-                mission_id = int(args[mission_idx + 1])
-                if download_mission(mission_id, config_manager, logger):
-                    return 0
-                else:
-                    return 1
-            else:
-                print("ERROR: --mission requires mission ID")
-                return 1
+            mission_id = int(cli.mission_id)
         except ValueError:
             print("ERROR: Invalid mission ID")
-            return 1
-    
-    elif '--retry' in args:
-        if retry_failed(config_manager, logger):
-            return 0
-        else:
-            return 1
-    
-    elif '--stats' in args:
+            return False
+        return download_mission(mission_id, config_manager, logger)
+
+    def run_stats():
         show_stats(config_manager)
-        return 0
-    
-    else:
-        print("ERROR: Unknown command")
-        print_usage()
-        return 1
+        return True
+
+    handlers = {
+        '--configure': lambda: configure_interactive(config_manager),
+        '--test': lambda: test_authentication(config_manager, logger),
+        '--download': lambda: download_new_images(config_manager, logger),
+        '--download-all': lambda: download_all_images(config_manager, logger),
+        '--mission': run_mission,
+        '--retry': lambda: retry_failed(config_manager, logger),
+        '--stats': run_stats,
+    }
+
+    handler = handlers.get(cli.command)
+    if handler is not None:
+        return 0 if handler() else 1
+
+    print("ERROR: Unknown command")
+    print_usage()
+    return 1
 
 
 if __name__ == '__main__':
@@ -580,6 +837,15 @@ if __name__ == '__main__':
         traceback.print_exc()
         exit_code = 1
     
-    # Use os._exit to avoid SystemExit exception traceback in IronPython
-    import os
+    # Use os._exit to avoid SystemExit exception traceback in IronPython;
+    # flush first so the last output lines are not lost with the buffers.
+    # The file logger buffers behind its drain thread, so it must be
+    # closed here or the tail of the log is dropped
+    try:
+        from logger import close_logger
+        close_logger()
+    except Exception:
+        pass
+    sys.stdout.flush()
+    sys.stderr.flush()
     os._exit(exit_code)
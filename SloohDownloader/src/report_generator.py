@@ -5,253 +5,153 @@ Generate reports in CSV and HTML formats
 """
 
 import os
-import csv
-from datetime import datetime
+import heapq
+import operator
+import threading
+import time
 
+# csv is imported inside export_csv so HTML-only runs never load it
 
-class ReportGenerator(object):
-    """Generate download reports in various formats"""
-    
-    def __init__(self, tracker, logger=None):
-        """
-        Initialize report generator.
-        
-        Args:
-            tracker: DownloadTracker instance
-            logger: Logger instance
-        """
-        self.tracker = tracker
-        self.logger = logger
-    
-    def _log(self, level, message):
-        """Internal logging helper"""
-        if self.logger:
-            if level == 'debug':
-                self.logger.debug(message)
-            elif level == 'info':
-                self.logger.info(message)
-            elif level == 'warning':
-                self.logger.warning(message)
-            elif level == 'error':
-                self.logger.error(message)
-    
-    def export_csv(self, output_path, filter_type=None, filter_object=None, 
-                   filter_telescope=None):
-        """
-        Export download history to CSV file.
-        
-        Args:
-            output_path: Path for output CSV file
-            filter_type: Filter by image type (optional)
-            filter_object: Filter by object name (optional)
-            filter_telescope: Filter by telescope name (optional)
-            
-        Returns:
-            bool: True if successful
-        """
-        try:
-            images = self.tracker.get_downloaded_images(
-                filter_type=filter_type,
-                filter_object=filter_object,
-                filter_telescope=filter_telescope
-            )
-            
-            if not images:
-                self._log('warning', "No images to export")
-                return False
-            
-            # Write CSV
-            with open(output_path, 'w', newline='') as csvfile:
-                fieldnames = [
-                    'image_id', 'customer_image_id', 'mission_id', 'filename',
-                    'object_name', 'telescope_name', 'image_type', 
-                    'file_size', 'download_date', 'file_path'
-                ]
-                
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for img in images:
-                    row = {
-                        'image_id': img.get('image_id', ''),
-                        'customer_image_id': img.get('customer_image_id', ''),
-                        'mission_id': img.get('mission_id', ''),
-                        'filename': img.get('filename', ''),
-                        'object_name': img.get('object_name', ''),
-                        'telescope_name': img.get('telescope_name', ''),
-                        'image_type': img.get('image_type', ''),
-                        'file_size': img.get('file_size', 0),
-                        'download_date': img.get('download_date', ''),
-                        'file_path': img.get('file_path', '')
-                    }
-                    writer.writerow(row)
-            
-            self._log('info', "CSV report exported: {0} ({1} images)".format(
-                output_path, len(images)))
-            return True
-            
-        except Exception as e:
-            self._log('error', "CSV export failed: {0}".format(str(e)))
-            return False
-    
-    def export_html(self, output_path, filter_type=None, filter_object=None,
-                    filter_telescope=None):
-        """
-        Export download history to HTML report.
-        
-        Args:
-            output_path: Path for output HTML file
-            filter_type: Filter by image type (optional)
-            filter_object: Filter by object name (optional)
-            filter_telescope: Filter by telescope name (optional)
-            
-        Returns:
-            bool: True if successful
-        """
-        try:
-            images = self.tracker.get_downloaded_images(
-                filter_type=filter_type,
-                filter_object=filter_object,
-                filter_telescope=filter_telescope
-            )
-            
-            stats = self.tracker.get_statistics()
-            
-            # Generate HTML
-            html = self._generate_html(images, stats, filter_type, 
-                                      filter_object, filter_telescope)
-            
-            with open(output_path, 'w') as f:
-                f.write(html)
-            
-            self._log('info', "HTML report exported: {0}".format(output_path))
-            return True
-            
-        except Exception as e:
-            self._log('error', "HTML export failed: {0}".format(str(e)))
-            return False
-    
-    def _generate_html(self, images, stats, filter_type, filter_object, filter_telescope):
-        """Generate HTML report content"""
-        
-        # Build filter description
-        filters_applied = []
-        if filter_type:
-            filters_applied.append("Type: {0}".format(filter_type))
-        if filter_object:
-            filters_applied.append("Object: {0}".format(filter_object))
-        if filter_telescope:
-            filters_applied.append("Telescope: {0}".format(filter_telescope))
-        
-        filter_text = ", ".join(filters_applied) if filters_applied else "None"
-        
-        # Format file size
-        def format_size(bytes_size):
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if bytes_size < 1024.0:
-                    return "{0:.2f} {1}".format(bytes_size, unit)
-                bytes_size /= 1024.0
-            return "{0:.2f} TB".format(bytes_size)
-        
-        # Build table rows
-        rows = []
-        for img in images:
-            rows.append("""
-                <tr>
-                    <td>{0}</td>
-                    <td>{1}</td>
-                    <td>{2}</td>
-                    <td>{3}</td>
-                    <td>{4}</td>
-                    <td>{5}</td>
-                    <td>{6}</td>
-                </tr>
-            """.format(
+# Fixed CSV column order, kept at module level so it is not rebuilt on
+# every export
+CSV_FIELDNAMES = ('image_id', 'customer_image_id', 'mission_id', 'filename',
+                  'object_name', 'telescope_name', 'image_type',
+                  'file_size', 'download_date', 'file_path')
+
+# One C-level tuple build per CSV row instead of ten dict.get calls
+_CSV_ROW_GETTER = operator.itemgetter(*CSV_FIELDNAMES)
+
+
+def _csv_row(img):
+    """Extract one CSV row tuple from an image record"""
+    try:
+        # Records from record_download carry every column
+        return _CSV_ROW_GETTER(img)
+    except KeyError:
+        # Row from an older tracker file: fill gaps
+        return (img.get('image_id', ''),
+                img.get('customer_image_id', ''),
+                img.get('mission_id', ''),
                 img.get('filename', ''),
-                img.get('object_name', 'Unknown'),
-                img.get('telescope_name', 'Unknown'),
+                img.get('object_name', ''),
+                img.get('telescope_name', ''),
                 img.get('image_type', ''),
-                format_size(img.get('file_size', 0)),
-                img.get('download_date', '').split('T')[0],  # Date only
-                img.get('file_path', '')
-            ))
-        
-        table_rows = "\n".join(rows)
-        
-        html = """<!DOCTYPE html>
+                img.get('file_size', 0),
+                img.get('download_date', ''),
+                img.get('file_path', ''))
+
+# Reports longer than this format their rows on worker threads
+_PARALLEL_ROW_THRESHOLD = 50000
+
+# One-pass C-level HTML escaping; html.escape makes several .replace
+# passes over each string
+_HTML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;',
+                               '>': '&gt;', '"': '&quot;'})
+
+
+def _stats_key(stats):
+    """Hashable fingerprint of a get_statistics() dict"""
+    return tuple(sorted(
+        (key, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+        for key, value in stats.items()))
+
+
+def _escape_html(text):
+    """Escape text for safe insertion into the HTML report"""
+    return text.translate(_HTML_ESCAPES)
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+
+def _format_size(bytes_size):
+    """Format a byte count as a human-readable size string"""
+    for unit in _SIZE_UNITS:
+        if bytes_size < 1024.0:
+            return "{0:.2f} {1}".format(bytes_size, unit)
+        bytes_size /= 1024.0
+    return "{0:.2f} TB".format(bytes_size)
+
+
+# HTML report skeleton. The CSS-heavy prefix is written verbatim so the
+# format machinery never scans it; only the small stats block and the
+# footer carry substitution slots.
+_HTML_REPORT_PREFIX = """<!DOCTYPE html>
 <html>
 <head>
     <title>Slooh Download Report</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             margin: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             padding: 20px;
             box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2c3e50;
             border-bottom: 3px solid #3498db;
             padding-bottom: 10px;
-        }}
-        .stats {{
+        }
+        .stats {
             display: flex;
             justify-content: space-around;
             margin: 20px 0;
             padding: 20px;
             background-color: #ecf0f1;
             border-radius: 5px;
-        }}
-        .stat-item {{
+        }
+        .stat-item {
             text-align: center;
-        }}
-        .stat-value {{
+        }
+        .stat-value {
             font-size: 24px;
             font-weight: bold;
             color: #3498db;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #7f8c8d;
             font-size: 14px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
-        }}
-        th {{
+        }
+        th {
             background-color: #3498db;
             color: white;
             padding: 12px;
             text-align: left;
-        }}
-        td {{
+        }
+        td {
             padding: 10px;
             border-bottom: 1px solid #ddd;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f5f5f5;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 20px;
             padding-top: 20px;
             border-top: 1px solid #ddd;
             color: #7f8c8d;
             font-size: 12px;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Slooh Image Download Report</h1>
         
-        <div class="stats">
+"""
+
+_HTML_REPORT_STATS = """        <div class="stats">
             <div class="stat-item">
                 <div class="stat-value">{total_images}</div>
                 <div class="stat-label">Total Images</div>
@@ -282,8 +182,9 @@ class ReportGenerator(object):
                 </tr>
             </thead>
             <tbody>
-                {table_rows}
-            </tbody>
+"""
+
+_HTML_REPORT_FOOTER = """            </tbody>
         </table>
         
         <div class="footer">
@@ -293,143 +194,36 @@ class ReportGenerator(object):
     </div>
 </body>
 </html>
-""".format(
-            total_images=stats.get('total_images', 0),
-            total_sessions=stats.get('total_sessions', 0),
-            total_size=format_size(stats.get('total_bytes', 0)),
-            filters=filter_text,
-            image_count=len(images),
-            table_rows=table_rows,
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        )
-        
-        return html
-    
-    def export_statistics_report(self, output_path, format='html'):
-        """
-        Export detailed statistics report.
-        
-        Args:
-            output_path: Path for output file
-            format: Output format ('html' or 'txt')
-            
-        Returns:
-            bool: True if successful
-        """
-        try:
-            stats = self.tracker.get_statistics()
-            
-            if format == 'html':
-                html = self._generate_statistics_html(stats)
-                with open(output_path, 'w') as f:
-                    f.write(html)
-            else:
-                # Text format
-                text = self._generate_statistics_text(stats)
-                with open(output_path, 'w') as f:
-                    f.write(text)
-            
-            self._log('info', "Statistics report exported: {0}".format(output_path))
-            return True
-            
-        except Exception as e:
-            self._log('error', "Statistics export failed: {0}".format(str(e)))
-            return False
-    
-    def _generate_statistics_text(self, stats):
-        """Generate text statistics report"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("SLOOH IMAGE DOWNLOAD STATISTICS")
-        lines.append("=" * 60)
-        lines.append("")
-        lines.append("Total Images Downloaded: {0}".format(stats.get('total_images', 0)))
-        lines.append("Total Download Sessions: {0}".format(stats.get('total_sessions', 0)))
-        lines.append("Total Data Downloaded: {0:.2f} GB".format(
-            stats.get('total_bytes', 0) / (1024.0 ** 3)))
-        lines.append("")
-        
-        # By type
-        lines.append("Downloads by Type:")
-        lines.append("-" * 40)
-        for img_type, count in sorted(stats.get('by_type', {}).items()):
-            lines.append("  {0:10s}: {1}".format(img_type, count))
-        lines.append("")
-        
-        # By telescope
-        lines.append("Downloads by Telescope:")
-        lines.append("-" * 40)
-        for telescope, count in sorted(stats.get('by_telescope', {}).items()):
-            lines.append("  {0:20s}: {1}".format(telescope, count))
-        lines.append("")
-        
-        # Top objects
-        lines.append("Top 10 Objects:")
-        lines.append("-" * 40)
-        by_object = sorted(stats.get('by_object', {}).items(), 
-                          key=lambda x: x[1], reverse=True)
-        for obj_name, count in by_object[:10]:
-            lines.append("  {0:30s}: {1}".format(obj_name[:30], count))
-        lines.append("")
-        
-        lines.append("=" * 60)
-        lines.append("Report generated: {0}".format(
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
-        
-        return "\n".join(lines)
-    
-    def _generate_statistics_html(self, stats):
-        """Generate HTML statistics report"""
-        # Format file size
-        def format_size(bytes_size):
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if bytes_size < 1024.0:
-                    return "{0:.2f} {1}".format(bytes_size, unit)
-                bytes_size /= 1024.0
-            return "{0:.2f} TB".format(bytes_size)
-        
-        # Build tables
-        type_rows = []
-        for img_type, count in sorted(stats.get('by_type', {}).items()):
-            type_rows.append("<tr><td>{0}</td><td>{1}</td></tr>".format(img_type, count))
-        
-        telescope_rows = []
-        for telescope, count in sorted(stats.get('by_telescope', {}).items()):
-            telescope_rows.append("<tr><td>{0}</td><td>{1}</td></tr>".format(telescope, count))
-        
-        object_rows = []
-        by_object = sorted(stats.get('by_object', {}).items(), 
-                          key=lambda x: x[1], reverse=True)
-        for obj_name, count in by_object[:15]:
-            object_rows.append("<tr><td>{0}</td><td>{1}</td></tr>".format(obj_name, count))
-        
-        html = """<!DOCTYPE html>
+"""
+
+# Statistics report skeleton, split the same way
+_STATS_REPORT_PREFIX = """<!DOCTYPE html>
 <html>
 <head>
     <title>Slooh Download Statistics</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             margin: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1000px;
             margin: 0 auto;
             background-color: white;
             padding: 20px;
             box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2c3e50;
             border-bottom: 3px solid #3498db;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #34495e;
             margin-top: 30px;
-        }}
-        .summary {{
+        }
+        .summary {
             display: flex;
             justify-content: space-around;
             margin: 30px 0;
@@ -437,46 +231,48 @@ class ReportGenerator(object):
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             border-radius: 10px;
-        }}
-        .summary-item {{
+        }
+        .summary-item {
             text-align: center;
-        }}
-        .summary-value {{
+        }
+        .summary-value {
             font-size: 32px;
             font-weight: bold;
-        }}
-        .summary-label {{
+        }
+        .summary-label {
             font-size: 14px;
             opacity: 0.9;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
-        }}
-        th {{
+        }
+        th {
             background-color: #3498db;
             color: white;
             padding: 12px;
             text-align: left;
-        }}
-        td {{
+        }
+        td {
             padding: 10px;
             border-bottom: 1px solid #ddd;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f5f5f5;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 40px;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Download Statistics</h1>
         
-        <div class="summary">
+"""
+
+_STATS_REPORT_BODY = """        <div class="summary">
             <div class="summary-item">
                 <div class="summary-value">{total_images}</div>
                 <div class="summary-label">Total Images</div>
@@ -533,14 +329,455 @@ class ReportGenerator(object):
     </div>
 </body>
 </html>
-""".format(
+"""
+
+
+class ReportGenerator(object):
+    """Generate download reports in various formats"""
+    
+    def __init__(self, tracker, logger=None):
+        """
+        Initialize report generator.
+        
+        Args:
+            tracker: DownloadTracker instance
+            logger: Logger instance
+        """
+        self.tracker = tracker
+        self.logger = logger
+        # Formatted table rows from the last HTML export, reused when the
+        # tracker state and filters have not changed
+        self._row_cache = {}
+        # Rendered statistics report from the last export, keyed on the
+        # stats content and format; HTML-then-text renders both fresh
+        # but repeats are free
+        self._stats_report_cache = {}
+    
+    def _log(self, level, message):
+        """Internal logging helper"""
+        if self.logger:
+            if level == 'debug':
+                self.logger.debug(message)
+            elif level == 'info':
+                self.logger.info(message)
+            elif level == 'warning':
+                self.logger.warning(message)
+            elif level == 'error':
+                self.logger.error(message)
+    
+    def export_csv(self, output_path, filter_type=None, filter_object=None, 
+                   filter_telescope=None):
+        """
+        Export download history to CSV file.
+        
+        Args:
+            output_path: Path for output CSV file
+            filter_type: Filter by image type (optional)
+            filter_object: Filter by object name (optional)
+            filter_telescope: Filter by telescope name (optional)
+            
+        Returns:
+            bool: True if successful
+        """
+        import csv
+        import io
+        
+        try:
+            images = self.tracker.get_downloaded_images(
+                filter_type=filter_type,
+                filter_object=filter_object,
+                filter_telescope=filter_telescope
+            )
+            
+            if not images:
+                self._log('warning', "No images to export")
+                return False
+            
+            # Plain csv.writer with tuples in fixed column order skips
+            # DictWriter's per-row fieldname mapping
+            def iter_rows():
+                for img in images:
+                    yield _csv_row(img)
+            
+            if len(images) < 200000:
+                # In-memory-sized export: build the whole document in a
+                # StringIO, encode once, write once — no per-row trip
+                # through the text I/O encoder
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                writer.writerow(CSV_FIELDNAMES)
+                writer.writerows(iter_rows())
+                data = buf.getvalue().encode('utf-8')
+                
+                fd = os.open(output_path,
+                             os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+            else:
+                # Too big to double-buffer: stream through a large buffer
+                with open(output_path, 'w', newline='',
+                          buffering=1024 * 1024, encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(CSV_FIELDNAMES)
+                    writer.writerows(iter_rows())
+            
+            self._log('info', "CSV report exported: {0} ({1} images)".format(
+                output_path, len(images)))
+            return True
+            
+        except Exception as e:
+            self._log('error', "CSV export failed: {0}".format(str(e)))
+            return False
+    
+    def export_html(self, output_path, filter_type=None, filter_object=None,
+                    filter_telescope=None):
+        """
+        Export download history to HTML report.
+        
+        Args:
+            output_path: Path for output HTML file
+            filter_type: Filter by image type (optional)
+            filter_object: Filter by object name (optional)
+            filter_telescope: Filter by telescope name (optional)
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            images = self.tracker.get_downloaded_images(
+                filter_type=filter_type,
+                filter_object=filter_object,
+                filter_telescope=filter_telescope
+            )
+            
+            if not images:
+                self._log('warning', "No images to export")
+                return False
+            
+            stats = self.tracker.get_statistics()
+            
+            # Build filter description
+            filters_applied = []
+            if filter_type:
+                filters_applied.append("Type: {0}".format(filter_type))
+            if filter_object:
+                filters_applied.append("Object: {0}".format(filter_object))
+            if filter_telescope:
+                filters_applied.append("Telescope: {0}".format(filter_telescope))
+            
+            filter_text = ", ".join(filters_applied) if filters_applied else "None"
+            
+            # Escape and format the rows once per tracker state; a
+            # repeat export with the same filters reuses them as-is
+            cache_key = (filter_type, filter_object, filter_telescope,
+                         self.tracker.data['metadata'].get('last_updated'),
+                         len(images))
+            rows = self._row_cache.get(cache_key)
+            if rows is None:
+                if len(images) > _PARALLEL_ROW_THRESHOLD:
+                    rows = self._format_rows_parallel(images)
+                else:
+                    rows = self._format_rows(images)
+                self._row_cache = {cache_key: rows}
+            
+            # Stream the report: header chunk, one write per row, footer
+            with open(output_path, 'w', buffering=1024 * 1024,
+                      encoding='utf-8') as f:
+                f.write(_HTML_REPORT_PREFIX)
+                f.write(_HTML_REPORT_STATS.format(
+                    total_images=stats.get('total_images', 0),
+                    total_sessions=stats.get('total_sessions', 0),
+                    total_size=_format_size(stats.get('total_bytes', 0)),
+                    filters=_escape_html(filter_text),
+                    image_count=len(images)))
+                
+                for row in rows:
+                    f.write(row)
+                
+                f.write(_HTML_REPORT_FOOTER.format(
+                    timestamp=time.strftime('%Y-%m-%d %H:%M:%S')))
+            
+            self._log('info', "HTML report exported: {0}".format(output_path))
+            return True
+            
+        except Exception as e:
+            self._log('error', "HTML export failed: {0}".format(str(e)))
+            return False
+    
+    def export_combined(self, csv_path, html_path, filter_type=None,
+                        filter_object=None, filter_telescope=None):
+        """
+        Export CSV and HTML reports from a single fetch of the images.
+        
+        Requesting both formats together skips the second
+        get_downloaded_images pass and shares the formatted rows.
+        
+        Args:
+            csv_path: Path for output CSV file
+            html_path: Path for output HTML file
+            filter_type: Filter by image type (optional)
+            filter_object: Filter by object name (optional)
+            filter_telescope: Filter by telescope name (optional)
+            
+        Returns:
+            bool: True if both exports succeeded
+        """
+        import csv
+        
+        try:
+            images = self.tracker.get_downloaded_images(
+                filter_type=filter_type,
+                filter_object=filter_object,
+                filter_telescope=filter_telescope
+            )
+            
+            if not images:
+                self._log('warning', "No images to export")
+                return False
+            
+            stats = self.tracker.get_statistics()
+            
+            filters_applied = []
+            if filter_type:
+                filters_applied.append("Type: {0}".format(filter_type))
+            if filter_object:
+                filters_applied.append("Object: {0}".format(filter_object))
+            if filter_telescope:
+                filters_applied.append("Telescope: {0}".format(filter_telescope))
+            
+            filter_text = ", ".join(filters_applied) if filters_applied else "None"
+            
+            if len(images) > _PARALLEL_ROW_THRESHOLD:
+                rows = self._format_rows_parallel(images)
+            else:
+                rows = self._format_rows(images)
+            
+            with open(csv_path, 'w', newline='', buffering=1024 * 1024,
+                      encoding='utf-8') as csvfile, \
+                 open(html_path, 'w', buffering=1024 * 1024,
+                      encoding='utf-8') as f:
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_FIELDNAMES)
+                
+                f.write(_HTML_REPORT_PREFIX)
+                f.write(_HTML_REPORT_STATS.format(
+                    total_images=stats.get('total_images', 0),
+                    total_sessions=stats.get('total_sessions', 0),
+                    total_size=_format_size(stats.get('total_bytes', 0)),
+                    filters=_escape_html(filter_text),
+                    image_count=len(images)))
+                
+                # One sweep feeds both sinks
+                for img, row in zip(images, rows):
+                    writer.writerow(_csv_row(img))
+                    f.write(row)
+                
+                f.write(_HTML_REPORT_FOOTER.format(
+                    timestamp=time.strftime('%Y-%m-%d %H:%M:%S')))
+            
+            self._log('info', "Combined report exported: {0}, {1} ({2} images)".format(
+                csv_path, html_path, len(images)))
+            return True
+            
+        except Exception as e:
+            self._log('error', "Combined export failed: {0}".format(str(e)))
+            return False
+    
+    def _format_rows(self, images):
+        """
+        Build the escaped <tr> strings for a slice of images.
+        
+        Args:
+            images: List of image records
+            
+        Returns:
+            list: One HTML row string per image
+        """
+        rows = []
+        append = rows.append
+        # Local bindings keep every name in the loop a fast frame-local
+        # lookup instead of a global/builtin one
+        escape = _escape_html
+        size = _format_size
+        # Plain concatenation: no per-row format-spec parse
+        # (f-strings are unavailable on IronPython)
+        for img in images:
+            get = img.get
+            append(
+                "<tr><td>" + escape(get('filename', '')) +
+                "</td><td>" + escape(get('object_name', 'Unknown')) +
+                "</td><td>" + escape(get('telescope_name', 'Unknown')) +
+                "</td><td>" + escape(get('image_type', '')) +
+                "</td><td>" + size(get('file_size', 0)) +
+                "</td><td>" + get('download_date', '')[:10] +
+                "</td><td>" + escape(get('file_path', '')) +
+                "</td></tr>\n")
+        return rows
+    
+    def _format_rows_parallel(self, images, workers=4):
+        """
+        Format rows in parallel chunks; IronPython threads have no GIL,
+        so the string work scales with cores on huge reports.
+        
+        Args:
+            images: List of image records
+            workers: Number of formatting threads
+            
+        Returns:
+            list: Row strings in the original image order
+        """
+        chunk_size = (len(images) + workers - 1) // workers
+        chunks = [images[i:i + chunk_size]
+                  for i in range(0, len(images), chunk_size)]
+        results = [None] * len(chunks)
+        
+        def format_chunk(index, chunk):
+            results[index] = self._format_rows(chunk)
+        
+        threads = [threading.Thread(target=format_chunk, args=(i, chunk))
+                   for i, chunk in enumerate(chunks)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        rows = []
+        for part in results:
+            rows.extend(part)
+        return rows
+    
+    def export_statistics_report(self, output_path, format='html'):
+        """
+        Export detailed statistics report.
+        
+        Args:
+            output_path: Path for output file
+            format: Output format ('html' or 'txt')
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            stats = self.tracker.get_statistics()
+            
+            if stats.get('total_images', 0) == 0:
+                self._log('warning', "No images to export")
+                return False
+            
+            # Skip regeneration when the stats are unchanged since the
+            # last export in this format
+            cache_key = (_stats_key(stats), format)
+            report = self._stats_report_cache.get(cache_key)
+            if report is None:
+                if format == 'html':
+                    report = self._generate_statistics_html(stats)
+                else:
+                    # Text format
+                    report = self._generate_statistics_text(stats)
+                self._stats_report_cache = {cache_key: report}
+            
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(report)
+            
+            self._log('info', "Statistics report exported: {0}".format(output_path))
+            return True
+            
+        except Exception as e:
+            self._log('error', "Statistics export failed: {0}".format(str(e)))
+            return False
+    
+    def _generate_statistics_text(self, stats):
+        """Generate text statistics report"""
+        lines = []
+        lines.append("=" * 60)
+        lines.append("SLOOH IMAGE DOWNLOAD STATISTICS")
+        lines.append("=" * 60)
+        lines.append("")
+        lines.append("Total Images Downloaded: {0}".format(stats.get('total_images', 0)))
+        lines.append("Total Download Sessions: {0}".format(stats.get('total_sessions', 0)))
+        lines.append("Total Data Downloaded: {0:.2f} GB".format(
+            stats.get('total_bytes', 0) / (1024.0 ** 3)))
+        lines.append("")
+        
+        # By type
+        lines.append("Downloads by Type:")
+        lines.append("-" * 40)
+        for img_type, count in sorted(stats.get('by_type', {}).items()):
+            lines.append("  {0:10s}: {1}".format(img_type, count))
+        lines.append("")
+        
+        # By telescope
+        lines.append("Downloads by Telescope:")
+        lines.append("-" * 40)
+        for telescope, count in sorted(stats.get('by_telescope', {}).items()):
+            lines.append("  {0:20s}: {1}".format(telescope, count))
+        lines.append("")
+        
+        # Top objects; nlargest keeps only the top slots instead of
+        # sorting every distinct object
+        lines.append("Top 10 Objects:")
+        lines.append("-" * 40)
+        by_object = heapq.nlargest(10, stats.get('by_object', {}).items(),
+                                   key=lambda x: x[1])
+        for obj_name, count in by_object:
+            lines.append("  {0:30s}: {1}".format(obj_name[:30], count))
+        lines.append("")
+        
+        lines.append("=" * 60)
+        lines.append("Report generated: {0}".format(
+            time.strftime('%Y-%m-%d %H:%M:%S')))
+        
+        return "\n".join(lines)
+    
+    def _generate_statistics_html(self, stats):
+        """Generate HTML statistics report"""
+        # Build tables
+        type_rows = []
+        for img_type, count in sorted(stats.get('by_type', {}).items()):
+            type_rows.append("<tr><td>{0}</td><td>{1}</td></tr>".format(img_type, count))
+        
+        telescope_rows = []
+        for telescope, count in sorted(stats.get('by_telescope', {}).items()):
+            telescope_rows.append("<tr><td>{0}</td><td>{1}</td></tr>".format(telescope, count))
+        
+        object_rows = []
+        by_object = heapq.nlargest(15, stats.get('by_object', {}).items(),
+                                   key=lambda x: x[1])
+        for obj_name, count in by_object:
+            object_rows.append("<tr><td>{0}</td><td>{1}</td></tr>".format(obj_name, count))
+        
+        return _STATS_REPORT_PREFIX + _STATS_REPORT_BODY.format(
             total_images=stats.get('total_images', 0),
             total_sessions=stats.get('total_sessions', 0),
-            total_size=format_size(stats.get('total_bytes', 0)),
+            total_size=_format_size(stats.get('total_bytes', 0)),
             type_rows="\n".join(type_rows),
             telescope_rows="\n".join(telescope_rows),
             object_rows="\n".join(object_rows),
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
         )
+
+
+# Convenience function for cache-friendly access
+def get_report_generator(tracker, logger=None):
+    """
+    Return the tracker's ReportGenerator, creating it on first use.
+    
+    The generator keeps the formatted-row and statistics caches, so
+    call sites that build a fresh instance per export never get a
+    cache hit; reusing one instance per tracker makes repeated
+    exports of unchanged data cheap.
+    
+    Args:
+        tracker: DownloadTracker instance
+        logger: Logger instance (used only when creating)
         
-        return html
+    Returns:
+        ReportGenerator: The instance attached to this tracker
+    """
+    generator = getattr(tracker, '_report_generator', None)
+    if generator is None:
+        generator = ReportGenerator(tracker, logger)
+        tracker._report_generator = generator
+    return generator
@@ -6,12 +6,88 @@ Handles authentication and communication with Slooh API using .NET HttpClient.
 import clr
 clr.AddReference('System')
 clr.AddReference('System.Net.Http')
-from System import Uri
+from System import Uri, TimeSpan
 from System.Net import CookieContainer, Cookie
-from System.Net.Http import HttpClient, HttpClientHandler, StringContent
+from System.Net.Http import (HttpClient, HttpClientHandler,
+                             HttpCompletionOption, HttpRequestMessage,
+                             HttpMethod, StringContent)
 from System.Net.Http.Headers import MediaTypeWithQualityHeaderValue
 from System.Text import Encoding
+from System.Threading import ThreadPool, WaitCallback
+from datetime import datetime
 import json
+import os
+import re
+import threading
+import time
+
+
+# The API returns dates like "Feb. 7, 2026" (occasionally the full
+# month name or ISO) and times like "18:04:33" or "18:04"; match them
+# directly instead of feeding strptime formats until one stops raising
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+_DATE_RE = re.compile(r'^([A-Za-z]+)\.? (\d{1,2}), (\d{4})$')
+_ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+_TIME_RE = re.compile(r'^(\d{1,2}):(\d{2})(?::(\d{2}))?$')
+
+# One reusable encoder with compact separators: json.dumps builds a
+# fresh JSONEncoder whenever it is given options, and the default
+# ', '/': ' separators pad every request body with dead whitespace
+_encode_json = json.JSONEncoder(separators=(',', ':')).encode
+
+
+# Pictures from the same mission share a display date, so parses are
+# memoized; the cap just guards against unbounded growth on huge scans
+_date_cache = {}
+_DATE_CACHE_MAX = 1024
+
+
+def _parse_display_date(text):
+    """Parse an API display date; returns a datetime or None"""
+    if text in _date_cache:
+        return _date_cache[text]
+    parsed = _parse_display_date_uncached(text)
+    if len(_date_cache) >= _DATE_CACHE_MAX:
+        _date_cache.clear()
+    _date_cache[text] = parsed
+    return parsed
+
+
+def _parse_display_date_uncached(text):
+    """Parse an API display date without the memo; returns datetime or None"""
+    match = _DATE_RE.match(text)
+    if match:
+        month = _MONTHS.get(match.group(1)[:3].title())
+        if not month:
+            return None
+        try:
+            return datetime(int(match.group(3)), month, int(match.group(2)))
+        except ValueError:
+            return None
+    match = _ISO_DATE_RE.match(text)
+    if match:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)),
+                            int(match.group(3)))
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_display_time(text):
+    """Parse an API display time; returns (hour, minute, second) or None"""
+    match = _TIME_RE.match(text)
+    if not match:
+        return None
+    hour = int(match.group(1))
+    minute = int(match.group(2))
+    second = int(match.group(3)) if match.group(3) else 0
+    if hour < 24 and minute < 60 and second < 60:
+        return (hour, minute, second)
+    return None
 
 
 class SloohClient(object):
@@ -33,8 +109,20 @@ class SloohClient(object):
         self.handler = HttpClientHandler()
         self.handler.CookieContainer = self.cookie_container
         self.handler.UseCookies = True
+        try:
+            # Enough pooled sockets for page prefetch plus the FITS
+            # fan-out (property exists on .NET Framework 4.7.1+)
+            self.handler.MaxConnectionsPerServer = 32
+        except Exception:
+            pass
         
         self.client = HttpClient(self.handler)
+        # API calls are small JSON round-trips; keep the default 100s
+        # timeout for stalled sockets down to something noticeable
+        self.client.Timeout = TimeSpan.FromSeconds(30)
+        # Keep-alive so paginating reuses the TCP+TLS session instead
+        # of paying the handshake per request
+        self.client.DefaultRequestHeaders.ConnectionClose = False
         self.client.DefaultRequestHeaders.Accept.Add(
             MediaTypeWithQualityHeaderValue('application/json'))
         self.client.DefaultRequestHeaders.Add('User-Agent', 'SloohDownloader/1.0')
@@ -43,6 +131,9 @@ class SloohClient(object):
         self.session_token = None
         self.user_data = {}
         self.is_authenticated = False
+        # Shared request preludes, built once per authentication
+        self._auth_prelude = None
+        self._auth_prelude_fits = None
     
     def _log(self, level, message):
         """Internal logging helper"""
@@ -56,6 +147,25 @@ class SloohClient(object):
             elif level == 'error':
                 self.logger.error(message)
     
+    def _refresh_auth_prelude(self):
+        """Rebuild the auth fields every API request carries"""
+        common = {
+            'at': self.user_data.get('at'),
+            'cid': self.user_data.get('cid'),
+            'token': self.user_data.get('token'),
+            'productId': 'ee26fb6d-3351-11eb-83b9-0655cc43ca95',
+            'locale': 'en'
+        }
+        self._auth_prelude = dict(common)
+        self._auth_prelude['sloohSessionToken'] = self.session_token
+        # The FITS endpoint wants the token under a different name
+        self._auth_prelude_fits = dict(common)
+        self._auth_prelude_fits['sloohSiteSessionToken'] = self.session_token
+    
+    def _debug_enabled(self):
+        """True when debug messages would actually be recorded"""
+        return self.logger is not None and self.logger.level <= self.logger.DEBUG
+    
     def _make_url(self, endpoint):
         """Create full URL from endpoint"""
         return "{0}{1}".format(self.base_url, endpoint)
@@ -75,25 +185,44 @@ class SloohClient(object):
             Exception: If request fails
         """
         url = self._make_url(endpoint)
-        json_string = json.dumps(data)
+        json_string = _encode_json(data)
         
-        self._log('debug', "POST {0}".format(url))
-        self._log('debug', "Data: {0}".format(json_string))
+        if self._debug_enabled():
+            self._log('debug', "POST {0}".format(url))
+            self._log('debug', "Data: {0}".format(json_string))
         
         content = StringContent(json_string, Encoding.UTF8, 'application/json')
         
         try:
-            response = self.client.PostAsync(url, content).Result
-            response_text = response.Content.ReadAsStringAsync().Result
-            
-            self._log('debug', "Response status: {0}".format(response.StatusCode))
-            self._log('debug', "Response: {0}".format(response_text[:500]))
+            request = HttpRequestMessage(HttpMethod.Post, url)
+            request.Content = content
+            # ResponseHeadersRead returns as soon as the status line and
+            # headers arrive instead of waiting for the body buffer, so
+            # the timeout covers server think-time rather than transfer
+            response = self.client.SendAsync(
+                request, HttpCompletionOption.ResponseHeadersRead).Result
+            # Take the body as raw UTF-8 bytes and decode once in
+            # Python; json.loads on IronPython 3.4 only accepts str,
+            # and this still skips the buffered managed-string copy
+            # ReadAsString would make of every response. The client
+            # timeout only covered the headers above, so bound the body
+            # transfer explicitly rather than blocking forever on a
+            # stalled connection
+            read_task = response.Content.ReadAsByteArrayAsync()
+            if not read_task.Wait(30000):
+                raise Exception("Timed out reading response body from {0}".format(url))
+            body = bytes(read_task.Result)
+            
+            if self._debug_enabled():
+                self._log('debug', "Response status: {0}".format(response.StatusCode))
+                self._log('debug', "Response: {0}".format(
+                    body[:500].decode('utf-8', 'replace')))
             
             if not response.IsSuccessStatusCode:
                 raise Exception("HTTP {0}: {1}".format(
-                    response.StatusCode, response_text))
+                    response.StatusCode, body.decode('utf-8', 'replace')))
             
-            return json.loads(response_text)
+            return json.loads(body.decode('utf-8'))
             
         except Exception as e:
             self._log('error', "Request failed: {0}".format(str(e)))
@@ -117,12 +246,14 @@ class SloohClient(object):
                 None
             ).Result
             
-            response_text = response.Content.ReadAsStringAsync().Result
+            body = bytes(response.Content.ReadAsByteArrayAsync().Result)
             response.EnsureSuccessStatusCode()
             
-            self._log('debug', "Session token response: {0}".format(response_text))
+            if self._debug_enabled():
+                self._log('debug', "Session token response: {0}".format(
+                    body.decode('utf-8', 'replace')))
             
-            data = json.loads(response_text)
+            data = json.loads(body.decode('utf-8'))
             
             # Check for session token (API returns 'sloohSessionToken')
             if 'sloohSessionToken' in data:
@@ -204,6 +335,7 @@ class SloohClient(object):
             }
             
             self.is_authenticated = True
+            self._refresh_auth_prelude()
             self._log('info', "Successfully authenticated as: {0}".format(
                 self.user_data.get('displayName', username)))
             
@@ -214,6 +346,79 @@ class SloohClient(object):
             self.is_authenticated = False
             raise
     
+    def save_session(self, path):
+        """
+        Persist the authenticated session so a later run can skip login.
+        
+        Args:
+            path: File to write the session snapshot to
+        """
+        if not self.is_authenticated:
+            return
+        
+        data = {
+            'base_url': self.base_url,
+            'session_token': self.session_token,
+            'user_data': self.user_data,
+            'saved_at': time.time()
+        }
+        
+        try:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            
+            self._log('debug', "Session cached to {0}".format(path))
+        except Exception as e:
+            self._log('warning', "Failed to cache session: {0}".format(str(e)))
+    
+    def load_session(self, path, max_age_minutes=30):
+        """
+        Restore a previously saved session, skipping the login round-trips.
+        
+        Args:
+            path: File written by save_session
+            max_age_minutes: Discard snapshots older than this
+            
+        Returns:
+            bool: True if a fresh session was restored
+        """
+        try:
+            if not os.path.exists(path):
+                return False
+            
+            with open(path, 'r') as f:
+                data = json.load(f)
+            
+            if data.get('base_url') != self.base_url:
+                return False
+            
+            age = time.time() - data.get('saved_at', 0)
+            if age < 0 or age > max_age_minutes * 60:
+                self._log('debug', "Cached session expired ({0:.0f}s old)".format(age))
+                return False
+            
+            self.session_token = data['session_token']
+            self.user_data = data.get('user_data', {})
+            
+            # Re-attach the session cookie just as get_session_token does
+            cookie = Cookie('_sloohsstkn', self.session_token)
+            cookie.Domain = '.slooh.com'
+            cookie.Path = '/'
+            self.cookie_container.Add(Uri(self.base_url), cookie)
+            
+            self.is_authenticated = True
+            self._refresh_auth_prelude()
+            self._log('info', "Reusing cached session (age {0:.0f}s)".format(age))
+            return True
+            
+        except Exception as e:
+            self._log('warning', "Failed to load cached session: {0}".format(str(e)))
+            return False
+    
     def get_user_gravity_status(self):
         """
         Get user's gravity/points status.
@@ -226,14 +431,7 @@ class SloohClient(object):
         
         self._log('debug', "Getting user gravity status...")
         
-        request_data = {
-            'sloohSessionToken': self.session_token,
-            'at': self.user_data.get('at'),
-            'cid': self.user_data.get('cid'),
-            'token': self.user_data.get('token'),
-            'productId': 'ee26fb6d-3351-11eb-83b9-0655cc43ca95',
-            'locale': 'en'
-        }
+        request_data = dict(self._auth_prelude)
         
         response = self._post_json('/api/newdashboard/getUserGravityStatus', request_data)
         return response
@@ -254,22 +452,14 @@ class SloohClient(object):
         
         self._log('debug', "Getting missions (first={0}, max={1})...".format(first, max_count))
         
-        request_data = {
-            'sloohSessionToken': self.session_token,
-            'at': self.user_data.get('at'),
-            'cid': self.user_data.get('cid'),
-            'token': self.user_data.get('token'),
-            'productId': 'ee26fb6d-3351-11eb-83b9-0655cc43ca95',
-            'locale': 'en',
-            'maxMissionCount': max_count,
-            'firstMissionNumber': first
-        }
+        request_data = dict(self._auth_prelude)
+        request_data['maxMissionCount'] = max_count
+        request_data['firstMissionNumber'] = first
         
         response = self._post_json('/api/images/getMissionImages', request_data)
         
         # Parse timestamps like C# code does
         if 'imageList' in response and response['imageList']:
-            from datetime import datetime
             for mission in response['imageList']:
                 mission['title'] = mission.get('imageTitle', '').strip()
                 
@@ -278,35 +468,15 @@ class SloohClient(object):
                 display_time = mission.get('displayTime', '').replace(' UTC', '')
                 
                 if display_date and display_time:
-                    try:
-                        # Try multiple date formats (API returns "Feb. 7, 2026" format)
-                        timestamp = None
-                        for fmt in ['%b. %d, %Y', '%B %d, %Y', '%Y-%m-%d']:
-                            try:
-                                timestamp = datetime.strptime(display_date, fmt)
-                                break
-                            except:
-                                continue
-                        
-                        if timestamp:
-                            # Parse time - handle both HH:MM and HH:MM:SS formats
-                            time_formats = ['%H:%M:%S', '%H:%M']
-                            clock = None
-                            for time_fmt in time_formats:
-                                try:
-                                    clock = datetime.strptime(display_time, time_fmt)
-                                    break
-                                except:
-                                    continue
-                            
-                            if clock:
-                                timestamp = timestamp.replace(
-                                    hour=clock.hour, 
-                                    minute=clock.minute, 
-                                    second=clock.second)
-                                mission['timestamp'] = timestamp.isoformat() + 'Z'
-                    except Exception as e:
-                        self._log('warning', "Failed to parse timestamp: {0}".format(str(e)))
+                    timestamp = _parse_display_date(display_date)
+                    if timestamp:
+                        clock = _parse_display_time(display_time)
+                        if clock:
+                            timestamp = timestamp.replace(
+                                hour=clock[0],
+                                minute=clock[1],
+                                second=clock[2])
+                            mission['timestamp'] = timestamp.isoformat() + 'Z'
         
         return response
     
@@ -329,18 +499,11 @@ class SloohClient(object):
         self._log('debug', "Getting pictures (first={0}, max={1}, mission={2}, viewType={3})...".format(
             first, max_count, mission_id, view_type))
         
-        request_data = {
-            'sloohSessionToken': self.session_token,
-            'at': self.user_data.get('at'),
-            'cid': self.user_data.get('cid'),
-            'token': self.user_data.get('token'),
-            'productId': 'ee26fb6d-3351-11eb-83b9-0655cc43ca95',
-            'locale': 'en',
-            'scheduledMissionId': mission_id,
-            'maxImageCount': max_count,
-            'firstImageNumber': first,
-            'viewType': view_type
-        }
+        request_data = dict(self._auth_prelude)
+        request_data['scheduledMissionId'] = mission_id
+        request_data['maxImageCount'] = max_count
+        request_data['firstImageNumber'] = first
+        request_data['viewType'] = view_type
         
         self._log('info', "API request: scheduledMissionId={0}, firstImageNumber={1}, maxImageCount={2}".format(
             mission_id, first, max_count))
@@ -362,54 +525,39 @@ class SloohClient(object):
         Extract essential data from API picture object into simple dictionary.
         Avoids circular references and .NET object issues.
         """
-        # Get string values safely
-        def safe_get(obj, key, default=''):
-            try:
-                val = obj.get(key, default)
-                return str(val) if val is not None else default
-            except:
-                return default
+        # json.loads already gives str for string fields; only the id
+        # fields can arrive as numbers and need an explicit str()
+        g = picture.get
         
         # Parse timestamp from displayDate and displayTime
         timestamp = None
-        display_date = safe_get(picture, 'displayDate')
-        display_time = safe_get(picture, 'displayTime').replace(' UTC', '')
+        display_date = g('displayDate') or ''
+        display_time = (g('displayTime') or '').replace(' UTC', '')
         
         if display_date and display_time:
-            from datetime import datetime
-            try:
-                # Try multiple date formats
-                dt = None
-                for fmt in ['%b. %d, %Y', '%B %d, %Y', '%Y-%m-%d']:
-                    try:
-                        dt = datetime.strptime(display_date, fmt)
-                        break
-                    except:
-                        continue
-                
-                if dt:
-                    # Parse time
-                    for time_fmt in ['%H:%M:%S', '%H:%M']:
-                        try:
-                            clock = datetime.strptime(display_time, time_fmt)
-                            timestamp = dt.replace(hour=clock.hour, minute=clock.minute, second=clock.second)
-                            break
-                        except:
-                            continue
-            except:
-                pass
+            dt = _parse_display_date(display_date)
+            if dt:
+                clock = _parse_display_time(display_time)
+                if clock:
+                    timestamp = dt.replace(
+                        hour=clock[0], minute=clock[1], second=clock[2])
+        
+        image_id = g('imageId')
+        customer_image_id = g('customerImageId')
+        mission_id = g('missionId')
+        scheduled_mission_id = g('scheduledMissionId')
         
         result = {
-            'imageId': safe_get(picture, 'imageId'),
-            'customerImageId': safe_get(picture, 'customerImageId'),
-            'missionId': safe_get(picture, 'missionId'),
-            'scheduledMissionId': safe_get(picture, 'scheduledMissionId'),
-            'imageTitle': safe_get(picture, 'imageTitle'),
-            'imageDownloadURL': safe_get(picture, 'imageDownloadURL'),
-            'imageDownloadFilename': safe_get(picture, 'imageDownloadFilename'),
-            'imageType': safe_get(picture, 'imageType', 'png'),
-            'telescopeName': safe_get(picture, 'telescopeName', 'Unknown'),
-            'instrumentName': safe_get(picture, 'instrumentName', 'Unknown'),
+            'imageId': str(image_id) if image_id is not None else '',
+            'customerImageId': str(customer_image_id) if customer_image_id is not None else '',
+            'missionId': str(mission_id) if mission_id is not None else '',
+            'scheduledMissionId': str(scheduled_mission_id) if scheduled_mission_id is not None else '',
+            'imageTitle': g('imageTitle') or '',
+            'imageDownloadURL': g('imageDownloadURL') or '',
+            'imageDownloadFilename': g('imageDownloadFilename') or '',
+            'imageType': g('imageType') or 'png',
+            'telescopeName': g('telescopeName') or 'Unknown',
+            'instrumentName': g('instrumentName') or 'Unknown',
             'displayDate': display_date,
             'displayTime': display_time,
             'photoRoll_position': photoroll_position
@@ -423,8 +571,6 @@ class SloohClient(object):
     
     def _parse_picture_timestamps(self, pictures):
         """Parse timestamps for a list of pictures"""
-        from datetime import datetime
-        
         # Process in small batches to avoid stack overflow
         for i, picture in enumerate(pictures):
             try:
@@ -435,30 +581,14 @@ class SloohClient(object):
                 display_time = picture.get('displayTime', '').replace(' UTC', '')
                 
                 if display_date and display_time:
-                    # Try multiple date formats
-                    timestamp = None
-                    for fmt in ['%b. %d, %Y', '%B %d, %Y', '%Y-%m-%d']:
-                        try:
-                            timestamp = datetime.strptime(display_date, fmt)
-                            break
-                        except:
-                            continue
-                    
+                    timestamp = _parse_display_date(display_date)
                     if timestamp:
-                        # Parse time
-                        clock = None
-                        for time_fmt in ['%H:%M:%S', '%H:%M']:
-                            try:
-                                clock = datetime.strptime(display_time, time_fmt)
-                                break
-                            except:
-                                continue
-                        
+                        clock = _parse_display_time(display_time)
                         if clock:
                             timestamp = timestamp.replace(
-                                hour=clock.hour, 
-                                minute=clock.minute, 
-                                second=clock.second)
+                                hour=clock[0],
+                                minute=clock[1],
+                                second=clock[2])
                             picture['timestamp'] = timestamp.isoformat() + 'Z'
                 
                 # Set defaults for missing data
@@ -470,6 +600,38 @@ class SloohClient(object):
                 # Skip problematic pictures silently
                 continue
     
+    def _begin_fetch(self, func):
+        """
+        Start func on the .NET thread pool so the round-trip overlaps
+        with work on the calling thread.
+        
+        Args:
+            func: Zero-argument callable performing the request
+            
+        Returns:
+            callable: Blocks until func finishes, then returns its
+            result or re-raises its exception
+        """
+        done = threading.Event()
+        outcome = {}
+        
+        def worker(state):
+            try:
+                outcome['result'] = func()
+            except Exception as e:
+                outcome['error'] = e
+            done.set()
+        
+        ThreadPool.QueueUserWorkItem(WaitCallback(worker))
+        
+        def wait():
+            done.wait()
+            if 'error' in outcome:
+                raise outcome['error']
+            return outcome['result']
+        
+        return wait
+    
     def get_all_missions(self, batch_size=50):
         """
         Get all missions by repeatedly calling API until all are retrieved.
@@ -487,8 +649,14 @@ class SloohClient(object):
         total_count = None
         retrieved = 0
         
+        # Keep one request in flight ahead of the caller so server
+        # latency overlaps with mission processing
+        pending = self._begin_fetch(
+            lambda f=first: self.get_missions(first=f, max_count=batch_size))
+        
         while True:
-            response = self.get_missions(first=first, max_count=batch_size)
+            response = pending()
+            pending = None
             
             if total_count is None:
                 total_count = response.get('totalCount', 0)
@@ -498,13 +666,18 @@ class SloohClient(object):
             if not missions:
                 break
             
+            if retrieved + len(missions) < total_count:
+                next_first = first + len(missions)
+                pending = self._begin_fetch(
+                    lambda f=next_first: self.get_missions(first=f, max_count=batch_size))
+            
             for mission in missions:
                 yield mission
                 retrieved += 1
             
             self._log('debug', "Retrieved {0}/{1} missions".format(retrieved, total_count))
             
-            if retrieved >= total_count:
+            if pending is None:
                 break
             
             first += len(missions)
@@ -523,6 +696,32 @@ class SloohClient(object):
         Yields:
             dict: Picture data with added 'photoRoll_position' field
         """
+        for batch in self.iter_picture_batches(
+                mission_id=mission_id, batch_size=batch_size,
+                view_type=view_type, max_scan=max_scan,
+                start_image=start_image):
+            for picture in batch:
+                yield picture
+    
+    def iter_picture_batches(self, mission_id=0, batch_size=50, view_type=None, max_scan=None, start_image=1):
+        """
+        Get all pictures one API batch at a time.
+        
+        Batch-level callers avoid the per-picture generator resume of
+        get_all_pictures and can queue a whole page of downloads at
+        once.
+        
+        Args:
+            mission_id: Mission ID to filter by (0 = all pictures)
+            batch_size: Number of pictures per request
+            view_type: View type - 'missions' or 'photoRoll' (auto-selected if None)
+            max_scan: Maximum number of pictures to retrieve (None = all available)
+            start_image: Starting image number in photoroll (1-based, default 1 = most recent)
+            
+        Yields:
+            list: Picture dicts with added 'photoRoll_position' field,
+            one list per API response
+        """
         if not self.is_authenticated:
             raise Exception("Not authenticated. Call login() first.")
         
@@ -535,13 +734,19 @@ class SloohClient(object):
         retrieved = 0
         photoroll_position = first  # Track absolute position in photoRoll (1-based)
         
-        self._log('info', "Starting get_all_pictures: mission_id={0}, batch_size={1}, view_type={2}, max_scan={3}, start_image={4}".format(
+        self._log('info', "Starting picture scan: mission_id={0}, batch_size={1}, view_type={2}, max_scan={3}, start_image={4}".format(
             mission_id, batch_size, view_type, max_scan if max_scan else 'unlimited', first))
         
+        # Keep one request in flight ahead of the caller so server
+        # latency overlaps with extraction and downloading
+        pending = self._begin_fetch(
+            lambda f=first: self.get_pictures(
+                first=f, max_count=batch_size,
+                mission_id=mission_id, view_type=view_type))
+        
         while True:
-            self._log('debug', "Requesting batch: first={0}, max_count={1}".format(first, batch_size))
-            
-            response = self.get_pictures(first=first, max_count=batch_size, mission_id=mission_id, view_type=view_type)
+            response = pending()
+            pending = None
             
             if total_count is None:
                 # totalCount might be a string
@@ -562,21 +767,33 @@ class SloohClient(object):
                 self._log('debug', "No pictures in response, ending pagination")
                 break
             
+            more_wanted = (retrieved + batch_count < total_count and
+                           not (max_scan and retrieved + batch_count >= max_scan))
+            if more_wanted:
+                next_first = first + batch_count
+                pending = self._begin_fetch(
+                    lambda f=next_first: self.get_pictures(
+                        first=f, max_count=batch_size,
+                        mission_id=mission_id, view_type=view_type))
+            
+            # Extract essential data into simple dicts to avoid .NET object issues
+            batch = []
             for picture in pictures:
-                # Extract essential data into a simple dict to avoid .NET object issues
-                simple_picture = self._extract_picture_data(picture, photoroll_position)
-                yield simple_picture
+                batch.append(self._extract_picture_data(picture, photoroll_position))
                 retrieved += 1
                 photoroll_position += 1
                 
                 # Check max_scan limit
                 if max_scan and retrieved >= max_scan:
                     self._log('info', "Reached max_scan limit: {0}".format(max_scan))
+                    yield batch
                     return
             
+            yield batch
+            
             self._log('info', "Retrieved {0}/{1} pictures so far".format(retrieved, total_count))
             
-            if retrieved >= total_count:
+            if pending is None:
                 self._log('info', "All pictures retrieved")
                 break
             
@@ -600,25 +817,21 @@ class SloohClient(object):
         if not mission_id or mission_id == 0:
             return  # No FITS for mission_id=0
         
-        request_data = {
-            'sloohSiteSessionToken': self.session_token,  # Note: sloohSiteSessionToken for FITS
-            'at': self.user_data.get('at'),
-            'cid': self.user_data.get('cid'),
-            'token': self.user_data.get('token'),
-            'productId': 'ee26fb6d-3351-11eb-83b9-0655cc43ca95',
-            'locale': 'en',
-            'scheduledMissionId': mission_id,
-            'maxImageCount': 100,  # Request up to 100 FITS files
-            'firstImageNumber': 1,
-            'viewType': 'missions'
-        }
+        request_data = dict(self._auth_prelude_fits)
+        request_data['scheduledMissionId'] = mission_id
+        request_data['maxImageCount'] = 100  # Request up to 100 FITS files
+        request_data['firstImageNumber'] = 1
+        request_data['viewType'] = 'missions'
         
-        self._log('debug', "Fetching FITS files for mission {0}".format(mission_id))
-        self._log('debug', "FITS request data: {0}".format(request_data))
+        if self._debug_enabled():
+            self._log('debug', "Fetching FITS files for mission {0}".format(mission_id))
+            self._log('debug', "FITS request data: {0}".format(request_data))
         response = self._post_json('/api/images/getMissionFITS', request_data)
         
-        # Log full response for debugging
-        self._log('debug', "FITS API full response: {0}".format(response))
+        # Log full response for debugging; str() of the whole dict is
+        # expensive, so only build it when debug is on
+        if self._debug_enabled():
+            self._log('debug', "FITS API full response: {0}".format(response))
         
         groups = response.get('groupList', [])
         
@@ -636,6 +849,56 @@ class SloohClient(object):
                     'missionId': str(mission_id)
                 }
     
+    def get_many_mission_fits(self, mission_ids, concurrency=8):
+        """
+        Fetch FITS listings for several missions concurrently.
+        
+        Round-trips run in parallel on the .NET thread pool, bounded by
+        a semaphore, so N missions cost roughly N/concurrency
+        round-trips instead of N.
+        
+        Args:
+            mission_ids: Iterable of mission IDs
+            concurrency: Maximum requests in flight at once
+            
+        Yields:
+            tuple: (mission_id, list of FITS file dicts), in completion
+            order; a failed mission yields an empty list
+        """
+        if not self.is_authenticated:
+            raise Exception("Not authenticated. Call login() first.")
+        
+        mission_ids = list(mission_ids)
+        slots = threading.Semaphore(concurrency)
+        lock = threading.Lock()
+        finished = []
+        available = threading.Semaphore(0)
+        
+        def worker(mission_id):
+            def run(state):
+                slots.acquire()
+                try:
+                    try:
+                        fits = list(self.get_mission_fits(mission_id))
+                    except Exception as e:
+                        self._log('warning', "FITS fetch failed for mission {0}: {1}".format(
+                            mission_id, str(e)))
+                        fits = []
+                finally:
+                    slots.release()
+                with lock:
+                    finished.append((mission_id, fits))
+                available.release()
+            ThreadPool.QueueUserWorkItem(WaitCallback(run))
+        
+        for mission_id in mission_ids:
+            worker(mission_id)
+        
+        for _ in range(len(mission_ids)):
+            available.acquire()
+            with lock:
+                yield finished.pop()
+    
     def test_connection(self):
         """
         Test connection to Slooh API.
@@ -34,18 +34,25 @@ def main():
     else:
         print("\nUsing saved credentials: {0}".format(username))
     
-    # Login
+    # Login - reuse a cached session when one is still fresh so repeat
+    # runs skip the token and login round-trips
     print("\nLogging in...")
     try:
         client = SloohClient('https://app.slooh.com', logger)
-        client.get_session_token()
-        user_data = client.login(username, password)
+        cache_path = config.get('slooh.session_cache', 'data/session_cache.json')
         
-        if user_data:
-            print("Logged in as: {0}".format(user_data.get('displayName', username)))
+        if client.load_session(cache_path):
+            print("Reusing cached session: {0}".format(
+                client.user_data.get('displayName', username)))
         else:
-            print("Login failed!")
-            return
+            user_data = client.login(username, password)
+            
+            if user_data:
+                print("Logged in as: {0}".format(user_data.get('displayName', username)))
+                client.save_session(cache_path)
+            else:
+                print("Login failed!")
+                return
             
     except Exception as e:
         print("Login error: {0}".format(str(e)))